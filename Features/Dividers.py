@@ -1,49 +1,133 @@
-from typing import List, Tuple
+import heapq
+import itertools
+import math
+from typing import Iterator, List, Tuple, Union
+
+import gmpy2
+import numpy as np
+from bitarray import bitarray
 
 from Features.MathOperations import operators_co
+from Features.PrimeNumbers import factorize, prime_num
+
+# Верхняя граница, до которой количества делителей берутся из решета
+_dense_sieve_limit = 5 * 10 ** 7
+# Решето выгоднее векторного пробного деления, пока его размер не больше стольких значений на одно число
+_sieve_values_ratio = 25
+# Граница, ниже которой тест простоты над массивом выполняется в int64 без переполнения
+_miller_rabin_limit = 3 * 10 ** 9
+# Наборы оснований Миллера — Рабина и границы, до которых они дают точный ответ
+_miller_rabin_bases = ((1373653, (2, 3)), (25326001, (2, 3, 5)), (3215031751, (2, 3, 5, 7)))
 
 
-def find_divisors(number: int) -> List[int]:
+def find_divisors(number: int, count_only: bool = False) -> Union[List[int], int]:
     """
     Находит все делители заданного числа.
 
+    Делители строятся из разложения числа на простые множители, поэтому время зависит от количества делителей,
+    а не от величины числа.
+
     :param number: Целое число.
-    :return: Список делителей.
+    :param count_only: Вернуть только количество делителей, не строя их список.
+    :return: Отсортированный список делителей или их количество.
 
     >>> find_divisors(28)
     [1, 2, 4, 7, 14, 28]
+    >>> find_divisors(10 ** 30, count_only=True)
+    961
+    """
+    if count_only:
+        return divisor_count(number) if number > 0 else 0
+    return sorted(iter_divisors(number))
+
+
+def iter_divisors(number: int, sort: bool = False) -> Iterator[int]:
+    """
+    Лениво перечисляет делители числа по его разложению на простые множители.
+
+    Без сортировки делители выдаются обходом в глубину по степеням простых множителей. С сортировкой
+    делители выдаются по возрастанию слиянием через кучу: для каждого простого множителя p^k поток
+    делителей остальных множителей умножается на p^0..p^k и потоки сливаются без построения полного списка.
+
+    :param number: Целое число.
+    :param sort: Выдавать делители по возрастанию.
+    :return: Генератор делителей.
+
+    >>> list(iter_divisors(12, sort=True))
+    [1, 2, 3, 4, 6, 12]
+    """
+    if number < 1:
+        return iter(())
+    factors = list(factorize(number).items())
+    return _sorted_divisors(factors) if sort else _divisors(factors)
+
+
+def _divisors(factors: List[Tuple[int, int]]) -> Iterator[int]:
+    """
+    Перечисляет делители без сортировки.
+
+    Множители делятся на две части с примерно равным количеством делителей; списки делителей частей
+    строятся явно (O(√d) памяти), а их попарные произведения выдаются лениво.
+
+    :param factors: Список пар (простой множитель, степень).
+    :return: Генератор делителей.
+    """
+    half, total = 1, math.prod(power + 1 for _, power in factors)
+    split = 0
+    while split < len(factors) and half * half < total:
+        half *= factors[split][1] + 1
+        split += 1
+    left, right = _divisor_list(factors[:split]), _divisor_list(factors[split:])
+    for divisor in left:
+        yield from map(divisor.__mul__, right)
+
+
+def _divisor_list(factors: List[Tuple[int, int]]) -> List[int]:
+    """
+    Строит список делителей произведения простых степеней.
+
+    :param factors: Список пар (простой множитель, степень).
+    :return: Список делителей в порядке построения.
+    """
+    divisors = [1]
+    for prime, power in factors:
+        divisors += [divisor * prime ** exponent for exponent in range(1, power + 1) for divisor in divisors]
+    return divisors
+
+
+def _sorted_divisors(factors: List[Tuple[int, int]]) -> Iterator[int]:
+    """
+    Перечисляет делители по возрастанию слиянием отсортированных потоков.
+
+    :param factors: Список пар (простой множитель, степень).
+    :return: Генератор делителей по возрастанию.
     """
-    divisors = []
-    for potential_divisor in range(1, int(number ** 0.5) + 1):
-        if number % potential_divisor == 0:
-            divisors.append(potential_divisor)
-            paired_divisor = number // potential_divisor
-            if potential_divisor != paired_divisor:
-                divisors.append(paired_divisor)
-    return sorted(divisors)
+    if not factors:
+        yield 1
+        return
+    (prime, power), rest = factors[-1], factors[:-1]
+    streams = itertools.tee(_sorted_divisors(rest), power + 1)
+    yield from heapq.merge(*(map((prime ** exponent).__mul__, stream) for exponent, stream in enumerate(streams)))
 
 
 def find_friendly_numbers(max_limit: int) -> List[int]:
     """
     Находит все дружественные числа до заданного числа.
 
+    Суммы собственных делителей всех чисел берутся из divisor_sum_sieve, пары проверяются векторно.
+
     :param max_limit: Максимальное число.
-    :return: Список дружественных чисел.
+    :return: Список дружественных чисел по возрастанию.
 
     >>> find_friendly_numbers(300)
     [220, 284]
     """
-    friendly_numbers = []
-    for number in range(1, max_limit + 1):
-        if number not in friendly_numbers:
-            divisors_sum = sum(find_divisors(number)[:-1])
-            if divisors_sum > max_limit or divisors_sum == number:
-                continue
-            counterpart_divisors_sum = sum(find_divisors(divisors_sum)[:-1])
-            if counterpart_divisors_sum == number != divisors_sum:
-                friendly_numbers.append(divisors_sum)
-                friendly_numbers.append(number)
-    return friendly_numbers
+    sums = divisor_sum_sieve(max_limit + 1)
+    numbers = np.arange(sums.size, dtype=np.int64)
+    candidates = (sums <= max_limit) & (sums != numbers)
+    friendly = np.zeros(sums.size, dtype=bool)
+    friendly[candidates] = sums[sums[candidates]] == numbers[candidates]
+    return np.flatnonzero(friendly).tolist()
 
 
 def check_divisors(comparison_operator: str, numbers: List[int], divisor_count: int) -> Tuple[
@@ -51,19 +135,308 @@ def check_divisors(comparison_operator: str, numbers: List[int], divisor_count:
     """
     Проверяет количество делителей для каждого числа в списке.
 
+    Количества делителей считаются одним проходом через divisor_counts, сравнение выполняется векторно.
+
     :param comparison_operator: Оператор сравнения ('<' или '>').
     :param numbers: Список чисел.
     :param divisor_count: Количество делителей.
     :return: Список чисел, количество их делителей и пары (число, количество делителей).
 
     >>> check_divisors('>', [10, 12, 15, 16], 4)
-    ([12, 15, 16], [6, 4, 5], [(12, 6), (15, 4), (16, 5)])
-    """
-    result = []
-    divisor_lengths = []
-    for number in numbers:
-        length = len(find_divisors(number))
-        if operators_co[comparison_operator](length, divisor_count):
-            result.append(number)
-            divisor_lengths.append(length)
+    ([12, 16], [6, 5], [(12, 6), (16, 5)])
+    """
+    counts = divisor_counts(numbers)
+    mask = operators_co[comparison_operator](counts, divisor_count)
+    result = list(itertools.compress(numbers, mask.tolist()))
+    divisor_lengths = counts[mask].tolist()
     return result, divisor_lengths, list(zip(result, divisor_lengths))
+
+
+def divisor_count_sieve(max_num: int) -> np.ndarray:
+    """
+    Вычисляет количество делителей d(n) для всех n < max_num.
+
+    :param max_num: Верхняя граница (не включается).
+    :return: Массив, где элемент n равен количеству делителей n (для 0 — ноль).
+
+    >>> divisor_count_sieve(13).tolist()
+    [0, 1, 2, 2, 3, 2, 4, 2, 4, 3, 4, 2, 6]
+    """
+    counts = np.zeros(max(max_num, 1), dtype=np.int64)
+    for divisor in range(1, math.isqrt(max_num - 1) + 1 if max_num > 1 else 1):
+        counts[divisor * divisor] += 1
+        counts[divisor * (divisor + 1)::divisor] += 2
+    return counts
+
+
+def divisor_count(number: int) -> int:
+    """
+    Вычисляет количество делителей числа по его разложению на простые множители: d(n) = Π(e + 1).
+
+    :param number: Целое число больше нуля.
+    :return: Количество делителей.
+
+    >>> divisor_count(10 ** 30)
+    961
+    """
+    return math.prod(power + 1 for power in factorize(number).values())
+
+
+def divisor_counts(numbers: List[int]) -> np.ndarray:
+    """
+    Вычисляет количество делителей для каждого числа списка.
+
+    Решето divisor_count_sieve стоит порядка максимума, а векторное пробное деление _sparse_divisor_counts —
+    порядка количества чисел, поэтому решето используется, пока максимум не больше _sieve_values_ratio значений
+    на одно число (и не больше _dense_sieve_limit). Числа вне int64 раскладываются на множители по одному.
+    Пробное деление выполняет один проход по массиву на каждое простое до ∛max, поэтому его время растёт
+    как количество чисел, умноженное на π(∛max): миллион чисел до 10^12 обрабатывается за несколько секунд,
+    а для чисел порядка 10^18 разумный размер списка — около 10^5.
+    Для чисел меньше единицы возвращается ноль.
+
+    :param numbers: Список чисел.
+    :return: Массив количеств делителей в порядке входного списка.
+
+    >>> divisor_counts([10, 12, 15, 16, 0]).tolist()
+    [4, 6, 4, 5, 0]
+    """
+    if not len(numbers):
+        return np.zeros(0, dtype=np.int64)
+
+    if not _fits_int64(numbers):
+        return np.fromiter((divisor_count(number) if number > 0 else 0 for number in numbers),
+                           dtype=np.int64, count=len(numbers))
+
+    values = np.asarray(numbers, dtype=np.int64)
+    maximum = int(values.max())
+    if maximum < _dense_sieve_limit and maximum <= values.size * _sieve_values_ratio:
+        counts = divisor_count_sieve(maximum + 1)
+        return np.where(values > 0, counts[np.maximum(values, 0)], 0)
+
+    counts = np.zeros(values.size, dtype=np.int64)
+    positive = values > 0
+    counts[positive] = _sparse_divisor_counts(values[positive])
+    return counts
+
+
+def _sparse_divisor_counts(values: np.ndarray) -> np.ndarray:
+    """
+    Вычисляет количества делителей массива положительных чисел без решета.
+
+    Весь массив векторно проверяется на делимость простыми числами до ∛max (умножением на обратный
+    по модулю 2^64 элемент вместо деления). У остатка все простые множители больше ∛max,
+    поэтому он равен 1, p, p² или p·q: квадрат проверяется целым корнем, простота — детерминированным
+    тестом Миллера — Рабина над массивом. Остатки, для которых тест не помещается в int64,
+    проверяются по одному через gmpy2.
+
+    :param values: Массив положительных чисел int64.
+    :return: Массив количеств делителей.
+    """
+    remaining = values.copy()
+    counts = np.ones(values.size, dtype=np.int64)
+    bound = round(int(values.max()) ** (1 / 3)) + 1
+    unsigned = remaining.view(np.uint64)
+    for prime in prime_num(bound + 1):
+        if prime == 2:
+            divisible = np.flatnonzero((remaining & 1) == 0)
+        else:
+            # n делится на нечётное p, если n · p⁻¹ (mod 2^64) не больше (2^64 − 1) / p
+            inverse, threshold = np.uint64(pow(prime, -1, 2 ** 64)), np.uint64((2 ** 64 - 1) // prime)
+            divisible = np.flatnonzero(unsigned * inverse <= threshold)
+        if not divisible.size:
+            continue
+        current = remaining[divisible] // prime
+        exponents = np.ones(divisible.size, dtype=np.int64)
+        mask = current % prime == 0
+        while mask.any():
+            current[mask] //= prime
+            exponents[mask] += 1
+            mask = current % prime == 0
+        remaining[divisible] = current
+        counts[divisible] *= exponents + 1
+
+    for position in np.flatnonzero(remaining >= _miller_rabin_limit).tolist():
+        cofactor = gmpy2.mpz(int(remaining[position]))
+        counts[position] *= 3 if gmpy2.is_square(cofactor) else 2 if gmpy2.is_prime(cofactor) else 4
+    cofactors = np.where(remaining < _miller_rabin_limit, remaining, 1)
+
+    roots = np.sqrt(cofactors.astype(np.float64)).astype(np.int64)
+    roots -= roots * roots > cofactors
+    roots += (roots + 1) * (roots + 1) <= cofactors
+    square = (roots * roots == cofactors) & (cofactors > 1)
+    other = (cofactors > 1) & ~square
+    # Остаток меньше bound² не может быть произведением двух множителей больше bound
+    prime = other & (cofactors < bound * bound)
+    uncertain = other & ~prime
+    prime[uncertain] = _is_prime_array(cofactors[uncertain])
+    counts[square] *= 3
+    counts[prime] *= 2
+    counts[other & ~prime] *= 4
+    return counts
+
+
+def _is_prime_array(numbers: np.ndarray) -> np.ndarray:
+    """
+    Проверяет простоту чисел массива детерминированным тестом Миллера — Рабина.
+
+    Набор оснований выбирается по наибольшему числу: 2, 3 точны до 1 373 653, 2, 3, 5 — до 25 326 001,
+    2, 3, 5, 7 — до 3 215 031 751. Произведения остатков помещаются в int64, пока числа меньше _miller_rabin_limit.
+
+    :param numbers: Массив чисел больше 7, меньших _miller_rabin_limit.
+    :return: Булев массив признаков простоты.
+    """
+    odd = numbers - 1
+    shifts = np.zeros(numbers.size, dtype=np.int64)
+    mask = odd % 2 == 0
+    while mask.any():
+        odd[mask] //= 2
+        shifts[mask] += 1
+        mask = odd % 2 == 0
+
+    prime = np.ones(numbers.size, dtype=bool)
+    if not numbers.size:
+        return prime
+    bases = next(bases for limit, bases in _miller_rabin_bases if numbers.max() < limit)
+    for base in bases:
+        power = _power_mod_array(base, odd, numbers)
+        passed = (power == 1) | (power == numbers - 1)
+        for step in range(1, int(shifts.max())):
+            power = np.where(passed, power, power * power % numbers)
+            passed |= (power == numbers - 1) & (step < shifts)
+        prime &= passed | (numbers == base)
+    return prime
+
+
+def _power_mod_array(base: int, exponents: np.ndarray, moduli: np.ndarray) -> np.ndarray:
+    """
+    Возводит base в степени exponents по модулям moduli поэлементно.
+
+    :param base: Основание.
+    :param exponents: Массив показателей.
+    :param moduli: Массив модулей.
+    :return: Массив остатков.
+    """
+    result = np.ones(moduli.size, dtype=np.int64)
+    power = base % moduli
+    exponents = exponents.copy()
+    while exponents.any():
+        odd = (exponents & 1).astype(bool)
+        result = np.where(odd, result * power % moduli, result)
+        power = power * power % moduli
+        exponents >>= 1
+    return result
+
+
+def _fits_int64(numbers: List[int]) -> bool:
+    """
+    Проверяет, помещаются ли все числа списка в int64.
+
+    :param numbers: Список чисел.
+    :return: True, если список можно без потерь преобразовать в массив int64.
+    """
+    bounds = np.iinfo(np.int64)
+    return bounds.min <= min(numbers) and max(numbers) <= bounds.max
+
+
+def divisor_sum_sieve(max_num: int) -> np.ndarray:
+    """
+    Вычисляет суммы собственных делителей σ(n) − n для всех n < max_num.
+
+    Для каждого d ≤ √max_num одной векторной операцией добавляются пары делителей (d, k) всех чисел d * k, k ≥ d.
+
+    :param max_num: Верхняя граница (не включается).
+    :return: Массив, где элемент n равен сумме собственных делителей n.
+
+    >>> divisor_sum_sieve(13).tolist()
+    [0, 0, 1, 1, 3, 1, 6, 1, 7, 4, 8, 1, 16]
+    """
+    sums = np.zeros(max(max_num, 1), dtype=np.int64)
+    for divisor in range(1, math.isqrt(max_num - 1) + 1 if max_num > 1 else 1):
+        square = divisor * divisor
+        sums[square] += divisor
+        pairs = np.arange(divisor + 1, (max_num - 1) // divisor + 1, dtype=np.int64)
+        sums[square + divisor::divisor] += divisor + pairs
+    return sums - np.arange(sums.size, dtype=np.int64)
+
+
+def sociable_chain(max_num: int) -> Tuple[int, List[int]]:
+    """
+    Находит самую длинную цепочку общительных чисел (аликвотный цикл), все члены которой меньше max_num.
+
+    Каждое число проходится один раз: общий массив эпох помечает числа номером старта,
+    с которого они были достигнуты, поэтому повторные обходы уже посещённых цепочек обрываются сразу.
+
+    :param max_num: Верхняя граница для членов цепочки (не включается).
+    :return: Длина цепочки и сама цепочка, начиная с её наименьшего члена.
+
+    >>> sociable_chain(300)
+    (2, [220, 284])
+    """
+    sums = divisor_sum_sieve(max_num).tolist()
+    epoch = [0] * len(sums)
+    position = [0] * len(sums)
+    best_chain = []
+
+    for start in range(2, max_num):
+        if epoch[start]:
+            continue
+        path = []
+        number = start
+        while 0 < number < max_num and not epoch[number]:
+            epoch[number] = start
+            position[number] = len(path)
+            path.append(number)
+            number = sums[number]
+
+        if 0 < number < max_num and epoch[number] == start:
+            chain = path[position[number]:]
+            smallest = chain.index(min(chain))
+            chain = chain[smallest:] + chain[:smallest]
+            if len(chain) > len(best_chain) or len(chain) == len(best_chain) and chain[0] < best_chain[0]:
+                best_chain = chain
+
+    return len(best_chain), best_chain
+
+
+def non_abundant_sums(max_num: int) -> Tuple[int, List[int]]:
+    """
+    Находит все числа до max_num, которые нельзя записать как сумму двух избыточных чисел.
+
+    Избыточные числа берутся из решета сумм делителей. Суммы отмечаются в битовом массиве:
+    для каждого избыточного a выполняется одно сдвинутое ИЛИ с массивом избыточных чисел
+    на отрезке между первым (не меньше 2a) и последним ещё не отмеченными числами.
+
+    :param max_num: Верхняя граница (включительно).
+    :return: Сумма найденных чисел и их список.
+
+    >>> non_abundant_sums(30)[1][-5:]
+    [25, 26, 27, 28, 29]
+    """
+    size = max_num + 1
+    sums = divisor_sum_sieve(size)
+    abundant_mask = sums > np.arange(size)
+    abundant = bitarray(np.packbits(abundant_mask).tobytes())[:size]
+    numbers = np.flatnonzero(abundant_mask)
+    odd = numbers[numbers % 2 == 1]
+    even = numbers[numbers % 2 == 0]
+    # Малые чётные числа быстро отмечают все чётные суммы, а нечётные суммы дают только редкие нечётные
+    # избыточные числа. Обработка их до остальных чётных быстро опускает последнее неотмеченное число,
+    # и оставшиеся сдвиги становятся короткими.
+    split = np.searchsorted(even, odd[0]) if odd.size else even.size
+
+    marked = bitarray(size)
+    marked.setall(False)
+    stop = size
+    for segment in (even[:split], odd, even[split:]):
+        for number in segment.tolist():
+            # Поиск справа (right=True) требует bitarray 3.x, см. requirements.txt
+            stop = marked.find(0, 0, stop, right=True) + 1
+            start = marked.find(0, 2 * number, stop)
+            if start == -1:
+                break
+            marked[start:stop] |= abundant[start - number:stop - number]
+
+    # Неотмеченные числа, кроме нуля
+    unmarked = np.flatnonzero(np.frombuffer(marked.unpack(), dtype=np.uint8) == 0)
+    result = unmarked[unmarked > 0].tolist()
+    return sum(result), result
@@ -1,173 +1,209 @@
-import functools
 import math
+from typing import Optional, Tuple
 
+import numpy as np
 
-@functools.cache
-def is_octagonal(number):
+# Наибольшее значение дискриминанта, для которого корень векторно вычисляется в int64
+_int64_discriminant_limit = 2 ** 62
+
+
+def polygonal_number(sides: int, index: int) -> int:
+    """
+    Вычисляет n-е s-угольное число: P(s, n) = ((s − 2)·n² − (s − 4)·n) / 2.
+
+    :param sides: Количество сторон многоугольника (не меньше 3).
+    :param index: Номер числа.
+    :return: s-угольное число с заданным номером.
+
+    >>> [polygonal_number(5, n) for n in range(1, 6)]
+    [1, 5, 12, 22, 35]
+    """
+    return ((sides - 2) * index * index - (sides - 4) * index) // 2
+
+
+def generalized_pentagonal_numbers(max_num: int) -> np.ndarray:
+    """
+    Строит обобщённые пятиугольные числа k·(3k − 1) / 2 для k = 1, −1, 2, −2, ..., не превосходящие max_num.
+
+    :param max_num: Верхняя граница (включительно).
+    :return: Массив чисел в порядке возрастания.
+
+    >>> generalized_pentagonal_numbers(40).tolist()
+    [1, 2, 5, 7, 12, 15, 22, 26, 35, 40]
+    """
+    count = polygonal_root(5, max_num)[0] or 0
+    indexes = np.arange(1, count + 2, dtype=np.int64)
+    numbers = np.empty(2 * indexes.size, dtype=np.int64)
+    numbers[0::2] = indexes * (3 * indexes - 1) // 2
+    numbers[1::2] = indexes * (3 * indexes + 1) // 2
+    return numbers[numbers <= max_num]
+
+
+def polygonal_root(sides: int, number: int) -> Tuple[Optional[int], bool]:
+    """
+    Находит номер наибольшего s-угольного числа, не превосходящего заданное.
+
+    Номер вычисляется из корня уравнения P(s, n) = number целочисленно через math.isqrt:
+    n = ⌊(s − 4 + √((s − 4)² + 8·(s − 2)·number)) / (2·(s − 2))⌋, поэтому результат точен для любых чисел.
+
+    :param sides: Количество сторон многоугольника (не меньше 3).
+    :param number: Проверяемое число.
+    :return: Номер n и признак того, что число само является s-угольным; (None, False) для чисел меньше единицы.
+
+    >>> polygonal_root(3, 10 ** 30 * (10 ** 30 + 1) // 2)
+    (1000000000000000000000000000000, True)
+    >>> polygonal_root(6, 44)
+    (4, False)
+    """
     if number <= 0:
         return None, False
+    root = math.isqrt((sides - 4) ** 2 + 8 * (sides - 2) * number)
+    index = (sides - 4 + root) // (2 * (sides - 2))
+    return index, polygonal_number(sides, index) == number
+
+
+def is_polygonal(sides: int, numbers) -> np.ndarray:
+    """
+    Проверяет сразу для всего массива, какие числа являются s-угольными.
+
+    :param sides: Количество сторон многоугольника (не меньше 3).
+    :param numbers: Массив или список целых чисел.
+    :return: Булев массив той же формы.
+
+    >>> is_polygonal(5, [1, 2, 5, 12, 13, 22]).tolist()
+    [True, False, True, True, False, True]
+    """
+    return polygonal_index(sides, numbers) > 0
+
+
+def polygonal_index(sides: int, numbers) -> np.ndarray:
+    """
+    Вычисляет номера s-угольных чисел сразу для всего массива.
+
+    Пока дискриминант помещается в int64, корень берётся из float64 и уточняется на единицу в обе стороны,
+    что даёт точный целый корень. Для больших чисел каждое значение проверяется через polygonal_root.
+
+    :param sides: Количество сторон многоугольника (не меньше 3).
+    :param numbers: Массив или список целых чисел.
+    :return: Массив номеров той же формы; 0 для чисел, не являющихся s-угольными.
+
+    >>> polygonal_index(6, [1, 6, 7, 15, 28]).tolist()
+    [1, 2, 0, 3, 4]
+    """
+    values = np.asarray(numbers)
+    limit = (_int64_discriminant_limit - (sides - 4) ** 2) // (8 * (sides - 2))
+    if values.dtype == object or values.size and (values.max() > limit or values.min() < -limit):
+        indexes = [index if flag else 0 for index, flag in map(lambda number: polygonal_root(sides, int(number)),
+                                                               values.ravel().tolist())]
+        return np.array(indexes, dtype=object if values.dtype == object else np.int64).reshape(values.shape)
+
+    values = values.astype(np.int64)
+    discriminant = (sides - 4) ** 2 + 8 * (sides - 2) * np.maximum(values, 0)
+    root = np.sqrt(discriminant.astype(np.float64)).astype(np.int64)
+    root -= root * root > discriminant
+    root += (root + 1) * (root + 1) <= discriminant
+    index = (sides - 4 + root) // (2 * (sides - 2))
+    member = (values > 0) & (((sides - 2) * index * index - (sides - 4) * index) // 2 == values)
+    return np.where(member, index, 0)
+
+
+def _nearest_polygonal(sides: int, number: int) -> Tuple[int, int]:
+    """
+    Находит наименьшее s-угольное число, не меньшее заданного, и шаг до следующего s-угольного числа.
+
+    :param sides: Количество сторон многоугольника.
+    :param number: Нижняя граница.
+    :return: s-угольное число и разность между ним и следующим s-угольным числом.
+    """
+    curr, flag = polygonal_root(sides, number)
+    if not flag:
+        curr = (curr or 0) + 1
+        number = polygonal_number(sides, curr)
+    return number, (sides - 2) * curr + 1
+
+
+def _next_polygonal(sides: int, number: int, step: Optional[int]) -> Tuple[int, int]:
+    """
+    Переходит к следующему s-угольному числу.
+
+    :param sides: Количество сторон многоугольника.
+    :param number: Текущее s-угольное число.
+    :param step: Разность между текущим и следующим числом; вычисляется, если не задана.
+    :return: Следующее s-угольное число и шаг от него.
+    """
+    if not step:
+        curr, _ = polygonal_root(sides, number)
+        step = (sides - 2) * curr + 1
+    return number + step, step + sides - 2
 
-    # Решаем уравнение для n
-    discriminant = 1 + 3 * number
-    sqrt_d = math.sqrt(discriminant)
 
-    # Вычисляем n
-    n = (1 + sqrt_d) / 3
-    return int(n), n.is_integer() and sqrt_d.is_integer()
+def is_octagonal(number):
+    return polygonal_root(8, number)
 
 
-@functools.cache
 def nearest_octagonal_positive(number):
-    curr, flag = is_octagonal(number)
-    if not flag:
-        curr += 1
-        number = curr * (3 * curr - 2)
-    return int(number), curr * 6 + 1
+    return _nearest_polygonal(8, number)
 
 
-@functools.cache
 def next_octagonal(number, step=None):
-    if not step:
-        curr, _ = is_octagonal(number)
-        step = curr * 6 + 1
-    return number + step, step + 6
+    return _next_polygonal(8, number, step)
 
 
-@functools.cache
 def is_triangular(number):
-    # Решаем уравнение n^2 + n - 2x = 0
-    if number <= 0:
-        return None, False
-    discriminant = 1 + 8 * number
+    return polygonal_root(3, number)
 
-    sqrt_d = math.sqrt(discriminant)
-    n = (-1 + sqrt_d) / 2
-    return int(n), n.is_integer() and sqrt_d.is_integer()
 
-
-@functools.cache
 def nearest_triangle_positive(number):
-    curr, flag = is_triangular(number)
-    if not flag:
-        curr += 1
-        number = curr * (curr + 1) / 2
-    return int(number), curr + 1
+    return _nearest_polygonal(3, number)
 
 
-@functools.cache
 def next_triangle(number, step=None):
-    if not step:
-        curr, _ = is_triangular(number)
-        step = curr + 1
-    return number + step, step + 1
+    return _next_polygonal(3, number, step)
 
 
-@functools.cache
 def is_square(number):
-    # Решаем уравнение n^2 + n - 2x = 0
-    if number <= 0:
-        return None, False
-
-    sqrt_n = math.sqrt(number)
-    return int(sqrt_n), sqrt_n.is_integer()
+    return polygonal_root(4, number)
 
 
-@functools.cache
 def nearest_square_positive(number):
-    curr, flag = is_square(number)
-    if not flag:
-        curr += 1
-        number = curr ** 2
-    return int(number), curr * 2 + 1
+    return _nearest_polygonal(4, number)
 
 
-@functools.cache
 def next_square(number, step=None):
-    if not step:
-        curr, _ = is_square(number)
-        step = curr * 2 + 1
-    return number + step, step + 2
+    return _next_polygonal(4, number, step)
 
 
-@functools.cache
 def is_pentagonal(number):
-    if number <= 0:
-        return None, False
-    discriminant = 1 + 24 * number
-
-    sqrt_d = math.sqrt(discriminant)
-    n = (1 + sqrt_d) / 6
-    return int(n), n.is_integer() and sqrt_d.is_integer()
+    return polygonal_root(5, number)
 
 
-@functools.cache
 def nearest_pentagonal_positive(number):
-    curr, flag = is_pentagonal(number)
-    if not flag:
-        curr += 1
-        number = curr * (3 * curr - 1) / 2
-    return int(number), curr * 3 + 1
+    return _nearest_polygonal(5, number)
 
 
-@functools.cache
 def next_pentagonal(number, step=None):
-    if not step:
-        curr, _ = is_pentagonal(number)
-        step = curr * 3 + 1
-    return number + step, step + 3
+    return _next_polygonal(5, number, step)
 
 
-@functools.cache
 def is_hexagonal(number):
-    if number <= 0:
-        return None, False
-    discriminant = 1 + 8 * number
+    return polygonal_root(6, number)
 
-    sqrt_d = math.sqrt(discriminant)
-    n = (1 + sqrt_d) / 4
-    return int(n), n.is_integer() and sqrt_d.is_integer()
 
-
-@functools.cache
 def nearest_hexagonal_positive(number):
-    curr, flag = is_pentagonal(number)
-    if not flag:
-        curr += 1
-        number = curr * (2 * curr - 1)
-    return int(number), curr * 4 + 1
+    return _nearest_polygonal(6, number)
 
 
-@functools.cache
 def next_hexagonal(number, step=None):
-    if not step:
-        curr, _ = is_pentagonal(number)
-        step = curr * 4 + 1
-    return number + step, step + 4
+    return _next_polygonal(6, number, step)
 
 
-@functools.cache
 def is_heptagonal(number):
-    if number <= 0:
-        return None, False
-    discriminant = 9 + 40 * number
-
-    sqrt_d = math.sqrt(discriminant)
-    n = (3 + sqrt_d) / 10
-    return int(n), n.is_integer() and sqrt_d.is_integer()
+    return polygonal_root(7, number)
 
 
-@functools.cache
 def nearest_heptagonal_positive(number):
-    curr, flag = is_pentagonal(number)
-    if not flag:
-        curr += 1
-        number = curr * (5 * curr - 3) / 2
-    return int(number), curr * 5 + 1
+    return _nearest_polygonal(7, number)
 
 
-@functools.cache
 def next_heptagonal(number, step=None):
-    if not step:
-        curr, _ = is_pentagonal(number)
-        step = curr * 5 + 1
-    return number + step, step + 5
+    return _next_polygonal(7, number, step)
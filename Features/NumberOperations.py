@@ -1,42 +1,257 @@
 import bisect
+import collections
+import heapq
+import itertools
 import math
+from typing import Iterator, List, Optional, Tuple, Union
 
-from .my_utils import get_digits
+import gmpy2
+import numpy as np
+from bitarray import bitarray
+
+from .my_utils import digit_sum, get_digits, word_values
+
+from .Figure_numbers import generalized_pentagonal_numbers
 
 from .MathOperations import perform_action
-from .PrimeNumbers import prime_num
+from .PrimeNumbers import prime_num, sieve_factorize, smallest_prime_factors
+
+# Количество сумм, обрабатываемых одним блоком в change_counts
+_change_block = 1 << 16
 
 
-def count_ways_to_make_change(coins: list, target_sum: int) -> int:
+def count_ways_to_make_change(coins: list, target_sum: int, mod: Optional[int] = None) -> int:
     """
     Считает количество способов сделать сумму с помощью заданных монет.
 
     :param coins: список доступных монет.
     :param target_sum: целевая сумма.
+    :param mod: модуль; если не задан, количество вычисляется точно.
     :return: количество способов.
+
+    >>> count_ways_to_make_change([1, 2, 5, 10, 20, 50, 100, 200], 200)
+    73682
+    """
+    # Монеты 1..target_sum дают все разбиения числа, которые считаются быстрее по теореме Эйлера.
+    # Сначала проверяется количество монет, чтобы не строить множества для коротких списков
+    if (mod is None or mod <= 2 ** 53) and len(coins) >= target_sum and len(coins) == len(set(coins)) and \
+            len({coin for coin in coins if 1 <= coin <= target_sum}) == target_sum:
+        return partition_count(target_sum, mod)
+    return change_counts(coins, [target_sum], mod)[0]
+
+
+def change_counts(coins: list, targets: list, mod: Optional[int] = None) -> List[int]:
+    """
+    Считает количество способов составить каждую из сумм за один проход динамики.
+
+    Точные значения считаются обычной динамикой над списком Python. По модулю для монеты c значения динамики
+    обновляются как w[i] = v[i] + w[i − c], то есть это префиксные суммы по остаткам от деления на c: массив
+    раскладывается в строки длины c, и одна строка суммируется с другой векторно в uint64. Суммы обрабатываются
+    блоками, для каждой монеты между блоками хранятся только последние c значений, поэтому память ограничена
+    размером блока и суммой номиналов, а не величиной целевой суммы.
+
+    :param coins: список доступных монет.
+    :param targets: список целевых сумм.
+    :param mod: модуль (меньше 2^63); если не задан, количества вычисляются точно.
+    :return: количества способов в порядке списка сумм.
+
+    >>> change_counts([1, 2, 5], [0, 5, 11, 100])
+    [1, 4, 11, 541]
+    >>> change_counts([1, 2, 5], [0, 5, 11, 100], 7)
+    [1, 4, 4, 2]
+    """
+    if not len(targets):
+        return []
+    maximum = max(targets)
+    if maximum < 0:
+        return [0] * len(targets)
+    coins = [coin for coin in coins if 0 < coin <= maximum]
+
+    if mod is None:
+        dp = [0] * (maximum + 1)
+        dp[0] = 1
+        for coin in coins:
+            for i in range(coin, maximum + 1):
+                dp[i] += dp[i - coin]
+        return [dp[target] if target >= 0 else 0 for target in targets]
+
+    block = min(maximum + 1, max([_change_block] + coins))
+    tails = [np.zeros(coin, dtype=np.uint64) for coin in coins]
+    order = np.asarray(targets, dtype=np.int64)
+    wanted = np.unique(order[order >= 0])
+    found = np.zeros(wanted.size, dtype=np.uint64)
+
+    for start in range(0, maximum + 1, block):
+        values = np.zeros(min(block, maximum + 1 - start), dtype=np.uint64)
+        if start == 0:
+            values[0] = 1 % mod
+        for position, coin in enumerate(coins):
+            values, tails[position] = _stride_prefix_sums(values, tails[position], coin, mod)
+        left, right = np.searchsorted(wanted, [start, start + values.size])
+        found[left:right] = values[wanted[left:right] - start]
+
+    answers = found[np.searchsorted(wanted, order).clip(max=wanted.size - 1)]
+    answers[order < 0] = 0
+    return answers.tolist()
+
+
+def _stride_prefix_sums(values: np.ndarray, tail: np.ndarray, step: int,
+                        mod: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Вычисляет w[i] = values[i] + w[i − step] по модулю для блока, продолжая значения w из предыдущего блока.
+
+    :param values: значения блока.
+    :param tail: последние step значений w перед блоком.
+    :param step: шаг (номинал монеты).
+    :param mod: модуль.
+    :return: значения w для блока и последние step значений w для следующего блока.
+    """
+    combined = np.concatenate((tail, values))
+    rows = -(-combined.size // step)
+    padded = np.zeros(rows * step, dtype=combined.dtype)
+    padded[:combined.size] = combined
+    padded = _cumulative_sum(padded.reshape(rows, step), mod).ravel()[:combined.size]
+    return padded[step:], padded[-step:]
+
+
+def _cumulative_sum(rows: np.ndarray, mod: int) -> np.ndarray:
+    """
+    Складывает строки массива нарастающим итогом по модулю.
+
+    Строки суммируются группами, сумма которых заведомо помещается в uint64,
+    а остаток предыдущей группы переносится в следующую.
+
+    :param rows: двумерный массив.
+    :param mod: модуль.
+    :return: массив нарастающих сумм по первой оси.
     """
-    dp = [0] * (target_sum + 1)
-    dp[0] = 1
+    group = max(1, (2 ** 64 - 1) // mod - 1)
+    carry = np.zeros(rows.shape[1], dtype=np.uint64)
+    result = np.empty_like(rows)
+    for first in range(0, rows.shape[0], group):
+        sums = np.cumsum(rows[first:first + group], axis=0, dtype=np.uint64)
+        sums += carry
+        result[first:first + group] = sums % np.uint64(mod)
+        carry = result[first + sums.shape[0] - 1]
+    return result
+
+
+def partition_count(number: int, mod: Optional[int] = None) -> int:
+    """
+    Считает количество разбиений числа на натуральные слагаемые p(n).
+
+    Это частный случай count_ways_to_make_change с монетами 1..n, но вычисляется за O(n√n)
+    по рекуррентности Эйлера из теоремы о пятиугольных числах.
+
+    :param number: целое неотрицательное число.
+    :param mod: модуль; если не задан, p(n) вычисляется точно.
+    :return: p(number) или p(number) по модулю mod.
+
+    >>> partition_count(100)
+    190569292
+    """
+    return int(partition_numbers(number, mod)[-1])
+
+
+def partition_numbers(max_num: int, mod: Optional[int] = None) -> Union[List[int], np.ndarray]:
+    """
+    Считает количества разбиений p(0), ..., p(max_num).
 
-    for coin in coins:
-        for i in range(coin, target_sum + 1):
-            dp[i] += dp[i - coin]
+    По теореме Эйлера о пятиугольных числах p(n) = Σ ±p(n − g) по обобщённым пятиугольным числам g ≤ n
+    со знаками +, +, −, −, ... Точные значения хранятся в списке целых Python; в модульном режиме значения
+    хранятся в массиве int64, и каждая сумма вычисляется одним скалярным произведением.
 
-    return dp[target_sum]
+    :param max_num: верхняя граница (включительно).
+    :param mod: модуль (не больше 2^53); если не задан, значения вычисляются точно.
+    :return: список точных значений или массив остатков по модулю mod.
+
+    >>> partition_numbers(10)
+    [1, 1, 2, 3, 5, 7, 11, 15, 22, 30, 42]
+    """
+    return list(itertools.islice(iter_partition_numbers(mod), max_num + 1)) if mod is None else \
+        _partition_table(max_num, mod)
+
+
+def iter_partition_numbers(mod: Optional[int] = None) -> Iterator[int]:
+    """
+    Лениво перечисляет количества разбиений p(0), p(1), ...
+
+    :param mod: модуль; если не задан, значения вычисляются точно.
+    :return: генератор значений p(n) или их остатков по модулю mod.
+    """
+    if mod is not None:
+        limit = 1024
+        start = 0
+        while True:
+            yield from _partition_table(limit, mod)[start:].tolist()
+            start, limit = limit + 1, limit * 2
+
+    partitions = []
+    bound = 1024
+    pentagonal = generalized_pentagonal_numbers(bound).tolist()
+    for number in itertools.count():
+        if number > bound:
+            bound *= 2
+            pentagonal = generalized_pentagonal_numbers(bound).tolist()
+        value = 1 if number == 0 else 0
+        for position, step in enumerate(pentagonal):
+            if step > number:
+                break
+            value += -partitions[number - step] if position & 2 else partitions[number - step]
+        partitions.append(value)
+        yield value
+
+
+def first_partition_divisible(divisor: int) -> int:
+    """
+    Находит наименьшее n, для которого p(n) делится на divisor.
+
+    :param divisor: делитель (не больше 2^53).
+    :return: искомое n.
+
+    >>> first_partition_divisible(7)
+    5
+    """
+    return next(number for number, value in enumerate(iter_partition_numbers(divisor)) if value % divisor == 0)
+
+
+def _partition_table(max_num: int, mod: int) -> np.ndarray:
+    """
+    Считает p(0), ..., p(max_num) по модулю mod в массиве int64.
+
+    :param max_num: верхняя граница (включительно).
+    :param mod: модуль.
+    :return: массив остатков.
+    """
+    pentagonal = generalized_pentagonal_numbers(max_num)
+    signs = np.where(np.arange(pentagonal.size) & 2, -1, 1).astype(np.int64)
+    counts = np.searchsorted(pentagonal, np.arange(max_num + 1), side='right')
+    partitions = np.zeros(max_num + 1, dtype=np.int64)
+    partitions[0] = 1 % mod
+    for number in range(1, max_num + 1):
+        count = counts[number]
+        partitions[number] = signs[:count] @ partitions[number - pentagonal[:count]] % mod
+    return partitions
 
 
 def sum_fifth_powers_digits(power: int) -> list:
     """
     Находит числа, равные сумме своих цифр в пятой степени.
 
+    Сумма степеней зависит только от набора цифр, поэтому перебираются мультимножества цифр
+    (combinations_with_replacement), а не все числа диапазона. Набор подходит, если отсортированные
+    цифры его суммы совпадают с ним самим.
+
     :param power: степень.
     :return: список подходящих чисел.
+
+    >>> sum_fifth_powers_digits(5)
+    [4150, 4151, 54748, 92727, 93084, 194979]
     """
     if power == 1:
         return []
     minim = 2 ** power
     char_num = 0
-    result = []
 
     while True:
         char_num += 1
@@ -44,137 +259,591 @@ def sum_fifth_powers_digits(power: int) -> list:
         if maxim < 10 ** char_num:
             break
 
-    for num in range(minim, maxim):
-        if num == sum(int(digit) ** power for digit in str(num)):
-            result.append(num)
+    powers = {digit: int(digit) ** power for digit in '0123456789'}
+    result = []
+    for length in range(1, char_num + 1):
+        for digits in itertools.combinations_with_replacement('0123456789', length):
+            num = sum(map(powers.__getitem__, digits))
+            if minim <= num < maxim and ''.join(sorted(str(num))) == ''.join(digits):
+                result.append(num)
 
-    return result
+    return sorted(result)
 
 
-def distinct_powers_count(max_num: int, min_num: int) -> tuple:
+def distinct_powers_count(max_num: int, min_num: int) -> int:
     """
-    Считает количество различных степеней чисел в заданном диапазоне.
+    Считает количество различных степеней a^b для a и b из диапазона [min_num, max_num].
+
+    Степени не вычисляются: каждое основание записывается как r^k, где r не является точной степенью,
+    и совпадения возможны только у степеней одного корня r: r^(k·b). Поэтому для корня достаточно посчитать
+    различные произведения k·b, что делается в битовой карте; результат зависит только от диапазона k
+    и запоминается. Корни больше √max_num дают только k = 1 и учитываются сразу все вместе.
 
     :param max_num: максимальное число.
-    :param min_num: минимальное число.
-    :return: множество различных степеней и их количество.
+    :param min_num: минимальное число (неотрицательное).
+    :return: количество различных степеней.
+
+    >>> distinct_powers_count(100, 2)
+    9183
+    """
+    if max_num < max(min_num, 0):
+        return 0
+    # Основания 0 и 1, а также показатель 0 дают только значения 0 и 1
+    count = (min_num <= 1) + (min_num <= 0 < max_num)
+    if max_num < 2:
+        return count
+
+    min_base, min_power = max(min_num, 2), max(min_num, 1)
+    powers = max_num - min_power + 1
+    root_limit = math.isqrt(max_num)
+    perfect_powers = set()
+    products = bitarray()
+    counted = {}
+
+    for root in range(2, root_limit + 1):
+        if root in perfect_powers:
+            continue
+        exponents = []
+        value, exponent = root, 1
+        while value <= max_num:
+            if value >= min_base:
+                exponents.append(exponent)
+            if exponent > 1:
+                perfect_powers.add(value)
+            value, exponent = value * root, exponent + 1
+        if not exponents:
+            continue
+        key = (exponents[0], exponents[-1])
+        if key not in counted:
+            counted[key] = _distinct_products(key, min_power, max_num, products)
+        count += counted[key]
+
+    first_large = max(min_base, root_limit + 1)
+    large_perfect = sum(1 for value in perfect_powers if value >= first_large)
+    count += max(max_num - first_large + 1 - large_perfect, 0) * powers
+    return count
+
+
+def _distinct_products(exponents: Tuple[int, int], min_power: int, max_power: int, products: bitarray) -> int:
+    """
+    Считает количество различных произведений k·b для k из отрезка exponents и b из [min_power, max_power].
+
+    :param exponents: наименьший и наибольший показатель k.
+    :param min_power: наименьший показатель b.
+    :param max_power: наибольший показатель b.
+    :param products: битовая карта, переиспользуемая между вызовами.
+    :return: количество различных произведений.
     """
-    result = set()
-    for num in range(min_num, max_num + 1):
-        for power in range(min_num, max_num + 1):
-            result.add(num ** power)
-    return sorted(result), len(result)
+    size = exponents[1] * max_power + 1
+    if len(products) < size:
+        products.extend(bitarray(size - len(products)))
+    products.setall(False)
+    for exponent in range(exponents[0], exponents[1] + 1):
+        products[exponent * min_power:exponent * max_power + 1:exponent] = True
+    return products.count(1, 0, size)
+
+
+def iter_distinct_powers(max_num: int, min_num: int) -> Iterator[int]:
+    """
+    Лениво перечисляет различные степени a^b для a и b из диапазона [min_num, max_num] по возрастанию.
+
+    Потоки степеней каждого основания сливаются через кучу, одинаковые значения пропускаются;
+    в памяти хранится по одной текущей степени на основание.
+
+    :param max_num: максимальное число.
+    :param min_num: минимальное число (неотрицательное).
+    :return: генератор степеней по возрастанию.
+
+    >>> list(iter_distinct_powers(5, 2))[:6]
+    [4, 8, 9, 16, 25, 27]
+    """
+    # Степени нуля (1, 0, 0, ...) не возрастают, поэтому их поток сортируется явно
+    streams = [map(base.__pow__, range(min_num, max_num + 1)) if base else
+               sorted(map(base.__pow__, range(min_num, max_num + 1))) for base in range(min_num, max_num + 1)]
+    previous = None
+    for value in heapq.merge(*streams):
+        if value != previous:
+            yield value
+            previous = value
 
 
 def fraction(maximum: int) -> tuple:
     """
     Находит знаменатель с самой длинной периодической частью в дроби 1/denominator.
 
-    :param maximum: максимальный знаменатель.
+    Длина периода 1/d равна мультипликативному порядку 10 по модулю d без множителей 2 и 5 и не превосходит d − 1,
+    поэтому знаменатели перебираются сверху вниз, пока d − 1 не станет меньше найденной длины: обычно поиск
+    заканчивается на первом простом числе, для которого 10 — первообразный корень.
+
+    :param maximum: максимальный знаменатель (не включается).
     :return: лучший знаменатель и длина периодической части.
+
+    >>> fraction(1000)
+    (983, 982)
     """
-    numerator = 1
+    factors = smallest_prime_factors(maximum)
     max_length = 0
     best_denominator = 0
 
-    for denominator in range(2, maximum):
-        remainders = {}
-        remainder = numerator
-        position = 0
+    for denominator in range(maximum - 1, 1, -1):
+        if denominator - 1 < max_length:
+            break
+        cycle_length = _decimal_period(denominator, factors)
+        if cycle_length and cycle_length >= max_length:
+            max_length = cycle_length
+            best_denominator = denominator
 
-        while remainder != 0 and remainder not in remainders:
-            remainders[remainder] = position
-            remainder = (remainder * 10) % denominator
-            position += 1
+    return best_denominator, max_length
 
-        if remainder != 0 and remainder in remainders:
-            cycle_length = position - remainders[remainder]
-            if cycle_length > max_length:
-                max_length = cycle_length
-                best_denominator = denominator
 
-    return best_denominator, max_length
+def recurring_cycle_lengths(maximum: int) -> np.ndarray:
+    """
+    Вычисляет длины периодов дробей 1/d для всех d < maximum.
+
+    Для простых p порядок 10 ищется делением φ(p) = p − 1 на его простые множители, для степеней простых
+    порядок увеличивается в p раз, когда 10^ord ≢ 1 по модулю следующей степени. Для остальных чисел,
+    взаимно простых с 10, длина периода — НОК длин для степени наименьшего простого делителя и частного,
+    что вычисляется векторно за несколько проходов. Множители 2 и 5 на длину периода не влияют.
+
+    :param maximum: верхняя граница знаменателей (не включается).
+    :return: массив, где элемент d равен длине периода 1/d (0 для конечных дробей).
+
+    >>> recurring_cycle_lengths(14).tolist()
+    [0, 0, 0, 1, 0, 0, 1, 6, 0, 1, 0, 2, 1, 6]
+    """
+    factors = smallest_prime_factors(maximum)
+    periods = np.zeros(max(maximum, 1), dtype=np.int64)[:maximum]
+
+    for prime in np.flatnonzero(factors == np.arange(factors.size)).tolist():
+        if prime in (0, 2, 5):
+            continue
+        order, power = _multiplicative_order(prime, prime - 1, factors), prime
+        while power < maximum:
+            if pow(10, order, power) != 1:
+                order *= prime
+            periods[power] = order
+            power *= prime
+
+    numbers = np.arange(periods.size, dtype=np.int64)
+    coprime = np.flatnonzero((numbers > 1) & (numbers % 2 != 0) & (numbers % 5 != 0))
+    primes = factors[coprime]
+    prime_powers, rests = primes.copy(), coprime // primes
+    divisible = rests % primes == 0
+    while divisible.any():
+        prime_powers[divisible] *= primes[divisible]
+        rests[divisible] //= primes[divisible]
+        divisible = rests % primes == 0
+
+    composite = rests > 1
+    coprime, prime_powers, rests = coprime[composite], prime_powers[composite], rests[composite]
+    # Каждый проход заполняет числа ещё с одним различным простым делителем
+    while coprime.size:
+        periods[coprime] = np.lcm(periods[prime_powers], periods[rests])
+        coprime, prime_powers, rests = (array[periods[coprime] == 0] for array in (coprime, prime_powers, rests))
+
+    cores = numbers.copy()
+    for prime in (2, 5):
+        divisible = (cores % prime == 0) & (cores > 0)
+        while divisible.any():
+            cores[divisible] //= prime
+            divisible = (cores % prime == 0) & (cores > 0)
+    return periods[cores]
+
+
+def _decimal_period(denominator: int, factors: np.ndarray) -> int:
+    """
+    Вычисляет длину периода дроби 1/denominator.
+
+    :param denominator: знаменатель.
+    :param factors: решето наименьших простых делителей, покрывающее знаменатель.
+    :return: длина периода (0 для конечных дробей).
+    """
+    for prime in (2, 5):
+        while denominator % prime == 0:
+            denominator //= prime
+    if denominator == 1:
+        return 0
+    totient = 1
+    for prime, power in sieve_factorize(denominator, factors).items():
+        totient *= prime ** (power - 1) * (prime - 1)
+    return _multiplicative_order(denominator, totient, factors)
+
+
+def _multiplicative_order(modulus: int, totient: int, factors: np.ndarray) -> int:
+    """
+    Находит порядок 10 по модулю modulus, деля φ(modulus) на его простые множители, пока 10^ord ≡ 1.
+
+    :param modulus: модуль, взаимно простой с 10.
+    :param totient: φ(modulus).
+    :param factors: решето наименьших простых делителей, покрывающее totient.
+    :return: мультипликативный порядок 10.
+    """
+    order = totient
+    for prime in sieve_factorize(totient, factors):
+        while order % prime == 0 and pow(10, order // prime, modulus) == 1:
+            order //= prime
+    return order
 
 
 def dictionary_permutations(nums: list, desired: int) -> str:
     """
     Возвращает нужную перестановку из списка чисел.
 
+    Перестановки упорядочены лексикографически и нумеруются с нуля; повторяющиеся числа
+    образуют мультимножество, и одинаковые перестановки считаются один раз.
+
     :param nums: список чисел.
     :param desired: индекс желаемой перестановки.
     :return: строка нужной перестановки.
+
+    >>> dictionary_permutations([0, 1, 2, 3, 4, 5, 6, 7, 8, 9], 999999)
+    '2783915460'
+    >>> dictionary_permutations([1, 1, 2], 2)
+    '211'
+    """
+    permutation = permutation_unrank(nums, desired)
+    return None if permutation is None else ''.join(map(str, permutation))
+
+
+def permutation_count(items: list) -> int:
+    """
+    Считает количество различных перестановок мультимножества: n! / (c1!·c2!·...).
+
+    :param items: список элементов.
+    :return: количество перестановок.
+
+    >>> permutation_count([1, 1, 2, 3])
+    12
+    """
+    total = math.factorial(len(items))
+    for count in collections.Counter(items).values():
+        total //= math.factorial(count)
+    return total
+
+
+def permutation_unrank(items: list, index: int) -> Optional[list]:
+    """
+    Находит перестановку с заданным номером среди лексикографически упорядоченных перестановок элементов.
+
+    Для различных элементов номер раскладывается в факториальной системе счисления делением на 2, 3, ..., n,
+    что работает с номерами любой величины. Каждая цифра — порядковый номер среди ещё не использованных
+    элементов, который находится в дереве Фенвика за O(log n). Для мультимножеств то же дерево хранит
+    количества значений, а число перестановок с заданным первым элементом пересчитывается на каждом шаге.
+
+    :param items: список элементов (могут повторяться).
+    :param index: номер перестановки, начиная с нуля.
+    :return: перестановка или None, если номер вне диапазона.
+
+    >>> permutation_unrank([3, 1, 2], 3)
+    [2, 3, 1]
+    """
+    values, counts = _distinct_counts(items)
+    total = permutation_count(items)
+    if not 0 <= index < total:
+        return None
+
+    tree = _fenwick_build(counts)
+    result = []
+    if len(values) == len(items):
+        for digit in _factorial_digits(index, len(items)):
+            position = _fenwick_find(tree, digit)
+            _fenwick_add(tree, position, -1)
+            result.append(values[position])
+        return result
+
+    for remaining in range(len(items), 0, -1):
+        position = _fenwick_find(tree, index * remaining // total)
+        index -= total * _fenwick_prefix(tree, position) // remaining
+        total = total * counts[position] // remaining
+        counts[position] -= 1
+        _fenwick_add(tree, position, -1)
+        result.append(values[position])
+    return result
+
+
+def permutation_rank(permutation: list) -> int:
+    """
+    Находит номер перестановки среди лексикографически упорядоченных перестановок её элементов.
+
+    :param permutation: перестановка (элементы могут повторяться).
+    :return: номер перестановки, начиная с нуля.
+
+    >>> permutation_rank([2, 3, 1])
+    3
+    """
+    values, counts = _distinct_counts(permutation)
+    positions = {value: position for position, value in enumerate(values)}
+    tree = _fenwick_build(counts)
+    total = permutation_count(permutation)
+    rank = 0
+    for remaining, item in zip(range(len(permutation), 0, -1), permutation):
+        position = positions[item]
+        rank += total * _fenwick_prefix(tree, position) // remaining
+        total = total * counts[position] // remaining
+        counts[position] -= 1
+        _fenwick_add(tree, position, -1)
+    return rank
+
+
+def permutations_unrank(items: list, indexes: list) -> List[Optional[list]]:
     """
-    nums = list(set(nums))
-    ready = []
+    Находит перестановки сразу для списка номеров.
 
-    if math.factorial(len(nums)) > desired:
-        while nums:
-            diapason = math.factorial(len(nums) - 1)
-            index = desired // diapason
-            ready.append(nums[index])
-            desired -= index * diapason
-            del nums[index]
-        return ''.join(map(str, ready))
+    Если элементы различны и номера помещаются в int64 (не больше 20 элементов), все перестановки строятся
+    одновременно: факториальные цифры всех номеров вычисляются векторно, а выбор элемента и его удаление
+    из остатка выполняются над матрицей остатков одной операцией на позицию. Иначе номера обрабатываются
+    по одному через permutation_unrank.
 
-    return None
+    :param items: список элементов (могут повторяться).
+    :param indexes: список номеров перестановок, начиная с нуля.
+    :return: список перестановок; None для номеров вне диапазона.
+
+    >>> permutations_unrank([1, 2, 3], [0, 5, 6])
+    [[1, 2, 3], [3, 2, 1], None]
+    """
+    values, _ = _distinct_counts(items)
+    total = permutation_count(items)
+    if len(values) != len(items) or total > np.iinfo(np.int64).max or not len(indexes) or \
+            not all(isinstance(index, (int, np.integer)) for index in indexes):
+        return [permutation_unrank(items, index) for index in indexes]
+
+    size = len(values)
+    numbers = np.asarray(indexes, dtype=object)
+    valid = np.array([0 <= index < total for index in indexes], dtype=bool)
+    remainders = np.where(valid, numbers, 0).astype(np.int64)
+    digits = np.empty((len(indexes), size), dtype=np.int64)
+    for base in range(1, size + 1):
+        remainders, digits[:, size - base] = np.divmod(remainders, base)
+
+    remaining = np.tile(np.arange(size, dtype=np.int64), (len(indexes), 1))
+    columns = np.arange(size, dtype=np.int64)
+    chosen = np.empty_like(digits)
+    rows = np.arange(len(indexes))
+    for position in range(size):
+        chosen[:, position] = remaining[rows, digits[:, position]]
+        shifted = np.concatenate((remaining[:, 1:], remaining[:, -1:]), axis=1)
+        remaining = np.where(columns >= digits[:, position, None], shifted, remaining)
+
+    return [[values[position] for position in row] if ok else None
+            for row, ok in zip(chosen.tolist(), valid.tolist())]
+
+
+def _distinct_counts(items: list) -> Tuple[list, List[int]]:
+    """
+    Сортирует различные элементы и считает их количества.
+
+    :param items: список элементов.
+    :return: отсортированные различные элементы и их количества.
+    """
+    counter = collections.Counter(items)
+    values = sorted(counter)
+    return values, [counter[value] for value in values]
+
+
+def _factorial_digits(index: int, size: int) -> List[int]:
+    """
+    Раскладывает номер в факториальной системе счисления.
+
+    :param index: номер (меньше size!).
+    :param size: количество цифр.
+    :return: цифры от старшей к младшей; i-я цифра меньше size − i.
+    """
+    digits = []
+    for base in range(1, size + 1):
+        index, digit = divmod(index, base)
+        digits.append(digit)
+    return digits[::-1]
+
+
+def _fenwick_build(counts: List[int]) -> List[int]:
+    """
+    Строит дерево Фенвика по списку количеств.
+
+    :param counts: количества.
+    :return: дерево (индексация с единицы, нулевой элемент не используется).
+    """
+    tree = [0] + list(counts)
+    for position in range(1, len(tree)):
+        parent = position + (position & -position)
+        if parent < len(tree):
+            tree[parent] += tree[position]
+    return tree
+
+
+def _fenwick_add(tree: List[int], position: int, delta: int) -> None:
+    """
+    Прибавляет delta к количеству с индексом position (с нуля).
+
+    :param tree: дерево Фенвика.
+    :param position: индекс.
+    :param delta: приращение.
+    """
+    position += 1
+    while position < len(tree):
+        tree[position] += delta
+        position += position & -position
+
+
+def _fenwick_prefix(tree: List[int], position: int) -> int:
+    """
+    Считает сумму количеств с индексами меньше position.
+
+    :param tree: дерево Фенвика.
+    :param position: индекс (с нуля).
+    :return: сумма количеств.
+    """
+    total = 0
+    while position > 0:
+        total += tree[position]
+        position -= position & -position
+    return total
+
+
+def _fenwick_find(tree: List[int], target: int) -> int:
+    """
+    Находит наименьший индекс, префиксная сумма до которого включительно больше target.
+
+    :param tree: дерево Фенвика.
+    :param target: порядковый номер (с нуля).
+    :return: индекс (с нуля).
+    """
+    position = 0
+    step = 1 << (len(tree) - 1).bit_length()
+    while step:
+        following = position + step
+        if following < len(tree) and tree[following] <= target:
+            position = following
+            target -= tree[following]
+        step >>= 1
+    return position
 
 
 def name_score(names: list) -> int:
     """
     Считает сумму очков имен на основе их позиции в алфавитном порядке.
 
+    Значения имен считаются одной векторной операцией word_values.
+
     :param names: список имен.
     :return: сумма очков имен.
     """
     names.sort()
-    total_score = 0
-    for index, name in enumerate(names):
-        name_score = sum(ord(char) - ord('A') + 1 for char in name)
-        total_score += name_score * (index + 1)
-
-    return total_score
+    scores = word_values(names) * np.arange(1, len(names) + 1, dtype=np.int64)
+    return sum(scores.tolist())
 
 
 def sum_digit_factorial(fact: int) -> int:
     """
     Считает сумму цифр факториала числа.
 
+    Цифры получаются субквадратичным переводом через digit_sum, поэтому факториалы
+    в сотни тысяч знаков обрабатываются без ограничения на длину str(int).
+
     :param fact: целое число для расчета факториала.
     :return: сумма цифр факториала.
+
+    >>> sum_digit_factorial(100)
+    648
     """
-    return sum(int(digit) for digit in str(math.factorial(fact)))
+    return digit_sum(gmpy2.fac(fact))
 
 
 def counting_sundays(max_year: int, min_year: int, day: int) -> int:
     """
     Считает количество воскресений, выпадающих на первое число месяца.
 
+    Первые числа месяцев считаются с февраля min_year по январь max_year включительно при условии,
+    что 1 января min_year приходится на день недели day. Сдвиг между заданным и настоящим днём недели
+    переводит задачу к подсчёту настоящих дней недели через weekday_dates_count за O(1).
+
     :param max_year: конечный год.
     :param min_year: начальный год.
     :param day: день недели от 1 до 7.
     :return: количество воскресений.
+
+    >>> counting_sundays(2001, 1900, 1)
+    173
+    """
+    if min_year >= max_year:
+        return 0
+    weekday = (_first_weekday(min_year) - day - 1) % 7 + 1
+    return (weekday_dates_count(max_year, min_year, weekday)
+            - (_first_weekday(min_year) == weekday) + (_first_weekday(max_year) == weekday))
+
+
+def weekday_dates_count(max_year: int, min_year: int, weekday: int = 7, day_of_month: int = 1) -> int:
+    """
+    Считает, сколько раз заданное число месяца приходится на заданный день недели в годах [min_year, max_year).
+
+    Григорианский календарь повторяется каждые 400 лет (146097 дней — ровно 20871 неделя), поэтому количества
+    для любого диапазона лет получаются из заранее вычисленных префиксных сумм по годам цикла за O(1).
+
+    :param max_year: конечный год (не включается).
+    :param min_year: начальный год.
+    :param weekday: день недели от 1 (понедельник) до 7 (воскресенье).
+    :param day_of_month: число месяца от 1 до 31.
+    :return: количество дат.
+
+    >>> weekday_dates_count(2001, 1901)
+    171
+    """
+    if min_year >= max_year:
+        return 0
+    return _dates_before(max_year, weekday, day_of_month) - _dates_before(min_year, weekday, day_of_month)
+
+
+def _dates_before(year: int, weekday: int, day_of_month: int) -> int:
+    """
+    Считает даты с заданным числом и днём недели от начала 0 года до начала year.
+
+    :param year: год.
+    :param weekday: день недели от 1 до 7.
+    :param day_of_month: число месяца.
+    :return: количество дат (отрицательное для годов до нулевого).
+    """
+    cycles, offset = divmod(year, 400)
+    column = _calendar_prefix[:, weekday - 1, day_of_month]
+    return cycles * int(column[-1]) + int(column[offset])
+
+
+def _first_weekday(year: int) -> int:
+    """
+    Находит день недели 1 января года (1 — понедельник, 7 — воскресенье).
+
+    :param year: год.
+    :return: день недели.
+    """
+    previous = year - 1
+    days = 365 * previous + previous // 4 - previous // 100 + previous // 400
+    # 1 января 1 года — понедельник
+    return days % 7 + 1
+
+
+def _calendar_prefix_table() -> np.ndarray:
+    """
+    Строит префиксные суммы дат 400-летнего цикла по годам, дням недели и числам месяца.
+
+    :return: массив (401, 7, 32): элемент [y, w, d] — количество дат с числом d и днём недели w + 1
+        в первых y годах цикла, начинающегося с 0 года.
     """
-    sunday_count = 0
-    while min_year < max_year:
-        feb = 28
-        if (min_year % 4 == 0 and min_year % 100 != 0) or (min_year % 400 == 0):
-            feb = 29
+    lengths = []
+    for year in range(400):
+        leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+        lengths += [31, 29 if leap else 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+    lengths = np.array(lengths, dtype=np.int64)
+    starts = np.cumsum(lengths) - lengths
+    days = np.arange(lengths.sum(), dtype=np.int64)
 
-        for month in range(1, 13):
-            if month in (4, 6, 9, 11):
-                days = 30
-            elif month == 2:
-                days = feb
-            else:
-                days = 31
+    day_years = np.repeat(np.repeat(np.arange(400), 12), lengths)
+    day_numbers = days - np.repeat(starts, lengths) + 1
+    weekdays = (_first_weekday(0) - 1 + days) % 7
 
-            day += days
-            if day % 7 == 0:
-                sunday_count += 1
+    counts = np.zeros((400, 7, 32), dtype=np.int64)
+    np.add.at(counts, (day_years, weekdays, day_numbers), 1)
+    return np.concatenate((np.zeros((1, 7, 32), dtype=np.int64), np.cumsum(counts, axis=0)))
 
-        min_year += 1
 
-    return sunday_count
+_calendar_prefix = _calendar_prefix_table()
 
 
 def sum_of_digits_of_degree(num: int, degree: int) -> int:
@@ -185,8 +854,10 @@ def sum_of_digits_of_degree(num: int, degree: int) -> int:
     :param degree: степень.
     :return: сумма цифр.
 
+    >>> sum_of_digits_of_degree(2, 1000)
+    1366
     """
-    return sum(map(int, str(num ** degree)))
+    return digit_sum(gmpy2.mpz(num) ** degree)
 
 
 def least_multiple(max_num: int) -> tuple:
@@ -286,7 +957,7 @@ def max_sum_digits(max_num: int, max_degree: int) -> tuple[int, tuple[int, int,
         cur_num = num
         for degree in range(2, max_degree):
             cur_num *= num
-            res = max(res, [sum(get_digits(cur_num)), (num, degree)], key=lambda x: x[0])
+            res = max(res, [digit_sum(cur_num), (num, degree)], key=lambda x: x[0])
     return res
 
 
@@ -1,54 +1,269 @@
-import bisect
+import math
+from typing import Iterator, Tuple
+
+import numpy as np
+
 from .my_utils import *
 
+# Количество палиндромов, проверяемых одним блоком
+_product_block = 64
+# Граница, ниже которой сумма числа с переворотом и её переворот помещаются в int64
+_lychrel_int_limit = 10 ** 17
+# Количество чисел, обрабатываемых одним блоком массивов цифр
+_lychrel_chunk = 1 << 18
+
+
 def find_palindromes(max_num: int, min_num: int) -> list:
     """
     Находит все числа-палиндромы в заданном диапазоне.
 
     :param min_num: минимальное число.
-    :param max_num: максимальное число.
+    :param max_num: максимальное число (не включается).
     :return: список чисел-палиндромов.
     """
-    list_palindromes = []
-    mx_length = number_len(max_num)
-    m_length = number_len(min_num)
+    return list(iter_palindromes(max_num, min_num))
+
+
+def iter_palindromes(max_num: int, min_num: int, base: int = 10, skip: int = 0) -> Iterator[int]:
+    """
+    Лениво перечисляет по возрастанию палиндромы из [min_num, max_num) в системе счисления base.
+
+    Палиндромы каждой длины строятся зеркалированием половин, память не зависит от размера диапазона.
+    Первый палиндром находится по его номеру без перебора предыдущих.
+
+    :param max_num: Верхняя граница диапазона (не включается).
+    :param min_num: Нижняя граница диапазона.
+    :param base: Основание системы счисления.
+    :param skip: Сколько первых палиндромов диапазона пропустить.
+    :return: Генератор палиндромов.
+
+    >>> list(iter_palindromes(200, 100, skip=5))
+    [151, 161, 171, 181, 191]
+    """
+    length, half = _palindrome_position(count_palindromes(min_num, 1, base) + skip, base)
+    while base ** (length - 1) < max_num:
+        half_length = (length + 1) // 2
+        shift = base ** (length - half_length)
+        while half < base ** half_length:
+            palindrome = half * shift + _reverse_in_base(half // base ** (length % 2), base)
+            if palindrome >= max_num:
+                return
+            yield palindrome
+            half += 1
+        length += 1
+        half = base ** ((length + 1) // 2 - 1)
+
+
+def count_palindromes(max_num: int, min_num: int, base: int = 10) -> int:
+    """
+    Считает палиндромы из [min_num, max_num) в системе счисления base без их построения.
 
-    m_pal = int(min_num / 10 ** (m_length // 2)) if m_length % 2 == 0 else int(min_num / 10 ** (m_length // 2))
-    mx_pal = int(max_num / 10 ** (mx_length // 2)) * 10 if mx_length % 2 == 0 else int(max_num / 10 ** (mx_length // 2))
+    :param max_num: Верхняя граница диапазона (не включается).
+    :param min_num: Нижняя граница диапазона.
+    :param base: Основание системы счисления.
+    :return: Количество палиндромов.
 
-    for half_palindrome in range(m_pal, mx_pal):
-        half_palindrome_str = str(half_palindrome)
+    >>> count_palindromes(10 ** 18, 1)
+    1999999998
+    """
+    return max(_count_below(max_num, base) - _count_below(min_num, base), 0)
 
-        # Проверка на нечетные палиндромы
-        odd_palindrome = int(half_palindrome_str + half_palindrome_str[-2::-1])
-        if odd_palindrome < max_num:
-            list_palindromes.append(odd_palindrome)
 
-        # Проверка на четные палиндромы
-        even_palindrome = int(half_palindrome_str + half_palindrome_str[::-1])
-        if even_palindrome < max_num:
-            list_palindromes.append(even_palindrome)
+def nth_palindrome(index: int, base: int = 10) -> int:
+    """
+    Находит палиндром по его номеру среди всех положительных палиндромов (нумерация с нуля).
+
+    :param index: Номер палиндрома.
+    :param base: Основание системы счисления.
+    :return: Палиндром с заданным номером.
 
-    list_palindromes.sort()
-    return list_palindromes[bisect.bisect_left(list_palindromes, min_num):]
+    >>> nth_palindrome(9)
+    11
+    """
+    length, half = _palindrome_position(index, base)
+    return half * base ** (length // 2) + _reverse_in_base(half // base ** (length % 2), base)
 
 
-def double_base_palindromes(max_num: int, min_num: int) -> list:
+def _palindrome_position(index: int, base: int) -> Tuple[int, int]:
+    """
+    Находит длину и левую половину палиндрома по его номеру.
+
+    :param index: Номер палиндрома среди всех положительных палиндромов (нумерация с нуля).
+    :param base: Основание системы счисления.
+    :return: Пара (длина палиндрома, левая половина с учётом среднего разряда).
+    """
+    length = 1
+    while index >= (per_length := (base - 1) * base ** ((length + 1) // 2 - 1)):
+        index -= per_length
+        length += 1
+    return length, base ** ((length + 1) // 2 - 1) + index
+
+
+def double_base_palindromes(max_num: int, min_num: int, bases: Tuple[int, int] = (10, 2)) -> list:
     """
     Вычисляет палиндромы, которые являются палиндромами как в десятичной, так и в двоичной системах счисления.
 
+    Палиндромы строятся зеркалированием половин в том основании, где их в диапазоне меньше,
+    а второе основание проверяется переворотом числа без построения списков.
+
     :param max_num: Верхняя граница диапазона.
     :param min_num: Нижняя граница диапазона.
+    :param bases: Пара оснований систем счисления.
     :return: Список чисел-палиндромов в двух системах счисления.
+
+    >>> double_base_palindromes(1000, 1)
+    [1, 3, 5, 7, 9, 33, 99, 313, 585, 717]
+    """
+    return list(iter_double_base_palindromes(max_num, min_num, bases))
+
+
+def iter_double_base_palindromes(max_num: int, min_num: int,
+                                 bases: Tuple[int, int] = (10, 2)) -> Iterator[int]:
+    """
+    Лениво перечисляет по возрастанию числа из [min_num, max_num), палиндромные в обоих основаниях.
+
+    :param max_num: Верхняя граница диапазона (не включается).
+    :param min_num: Нижняя граница диапазона.
+    :param bases: Пара оснований систем счисления.
+    :return: Генератор чисел-палиндромов в двух системах счисления.
+    """
+    first, second = sorted(bases, key=lambda base: count_palindromes(max_num, min_num, base))
+    return (number for number in iter_palindromes(max_num, min_num, first)
+            if is_palindrome_in_base(number, second))
+
+
+def is_palindrome_in_base(number: int, base: int) -> bool:
+    """
+    Проверяет, является ли число палиндромом в системе счисления base.
+
+    :param number: Число для проверки.
+    :param base: Основание системы счисления.
+    :return: True, если число палиндром, иначе False.
+    """
+    if number % base == 0:
+        return number == 0
+    return _reverse_in_base(number, base) == number
+
+
+def _reverse_in_base(number: int, base: int) -> int:
     """
-    palindromes_list = find_palindromes(max_num, min_num)
-    double_base_palindromes_list = []
+    Переворачивает запись числа в системе счисления base.
 
-    for palindrome in palindromes_list:
-        if bin(palindrome)[2:] == bin(palindrome)[2:][::-1]:
-            double_base_palindromes_list.append(palindrome)
+    Для оснований 2 и 10 используется переворот строкового представления, для остальных — деление.
+
+    :param number: Исходное число.
+    :param base: Основание системы счисления.
+    :return: Число с перевёрнутой записью.
+    """
+    if base == 2:
+        return int(bin(number)[:1:-1], 2) if number else 0
+    if base == 10:
+        return int(str(number)[::-1])
+    reversed_num = 0
+    while number:
+        number, digit = divmod(number, base)
+        reversed_num = reversed_num * base + digit
+    return reversed_num
+
+
+def _length_in_base(number: int, base: int) -> int:
+    """
+    Вычисляет количество цифр числа в системе счисления base.
 
-    return double_base_palindromes_list
+    :param number: Число больше нуля.
+    :param base: Основание системы счисления.
+    :return: Количество цифр.
+    """
+    length = 1
+    while base ** length <= number:
+        length += 1
+    return length
+
+
+def _count_below(bound: int, base: int) -> int:
+    """
+    Считает палиндромы в системе счисления base из [1, bound) без их построения.
+
+    :param bound: Верхняя граница (не включается).
+    :param base: Основание системы счисления.
+    :return: Количество палиндромов.
+    """
+    if bound <= 1:
+        return 0
+    length = _length_in_base(bound - 1, base)
+    count = sum((base - 1) * base ** ((size + 1) // 2 - 1) for size in range(1, length))
+    half_length = (length + 1) // 2
+    shift = base ** (length - half_length)
+    half = (bound - 1) // shift
+    count += half - base ** (half_length - 1)
+    if half * shift + _reverse_in_base(half // base ** (length % 2), base) < bound:
+        count += 1
+    return count
+
+
+def largest_palindrome_product(chars: int) -> Tuple[int, int, int]:
+    """
+    Находит наибольший палиндром, являющийся произведением двух chars-значных чисел.
+
+    Палиндромы перебираются по убыванию. Для палиндрома длины 2 * chars множители записываются как
+    10^chars − x и 10^chars − y: из P = U·10^chars + L следует x + y = s и x·y = (U + s − 10^chars)·10^chars + L,
+    поэтому проверка сводится к нескольким значениям s и проверке дискриминанта на точный квадрат.
+    Палиндромы длины 2 * chars − 1 проверяются блоками: меньший множитель лежит в [⌈P / max⌉, √P],
+    делимость проверяется сразу для всего блока одной матрицей остатков.
+
+    :param chars: Количество знаков в множителях.
+    :return: Палиндром и два его множителя по возрастанию; (0, 0, 0), если палиндром не найден.
+
+    >>> largest_palindrome_product(3)
+    (906609, 913, 993)
+    """
+    power = 10 ** chars
+    for half in range(power - 1, power // 10 - 1, -1):
+        lower = _reverse_in_base(half, 10)
+        # Сумма x + y не меньше power − half, иначе произведение x·y отрицательно
+        total = power - half
+        while total < 2 * (power - power // 10):
+            product = (total - power + half) * power + lower
+            if total * total < 4 * product:
+                break
+            root = math.isqrt(total * total - 4 * product)
+            if root * root == total * total - 4 * product and total + root <= 2 * (power - power // 10):
+                return half * power + lower, power - (total + root) // 2, power - (total - root) // 2
+            total += 1
+
+    return _largest_odd_palindrome_product(chars)
+
+
+def _largest_odd_palindrome_product(chars: int) -> Tuple[int, int, int]:
+    """
+    Находит наибольший палиндром длины 2 * chars − 1, являющийся произведением двух chars-значных чисел.
+
+    :param chars: Количество знаков в множителях.
+    :return: Палиндром и два его множителя по возрастанию; (0, 0, 0), если палиндром не найден.
+    """
+    max_num = 10 ** chars - 1
+    min_num = 10 ** (chars - 1)
+    dtype = np.int64 if max_num * max_num <= np.iinfo(np.int64).max else object
+
+    half = max_num
+    while half >= min_num:
+        halves = range(half, max(half - _product_block, min_num - 1), -1)
+        half = halves[-1] - 1
+        palindromes = np.array([int(str(h) + str(h)[-2::-1]) for h in halves], dtype=dtype)
+
+        lowest = max(min_num, -(-int(palindromes[-1]) // max_num))
+        highest = min(max_num, math.isqrt(int(palindromes[0])))
+        candidates = np.arange(lowest, highest + 1, dtype=np.int64).astype(dtype)
+        if not candidates.size:
+            continue
+        quotients, remainders = palindromes[:, None] // candidates, palindromes[:, None] % candidates
+        hits = (remainders == 0) & (quotients >= candidates) & (quotients <= max_num)
+        rows = np.flatnonzero(hits.any(axis=1))
+        if rows.size:
+            column = int(np.argmax(hits[rows[0]]))
+            return int(palindromes[rows[0]]), int(candidates[column]), int(quotients[rows[0], column])
+
+    return 0, 0, 0
 
 
 def lychrel_numbers(max_num: int, iters: int = 50) -> list[tuple[int, int]]:
@@ -57,6 +272,10 @@ def lychrel_numbers(max_num: int, iters: int = 50) -> list[tuple[int, int]]:
 
     Число Личреля — это число, которое не становится палиндромом при реверсивном сложении в течение `iters` итераций.
 
+    Число n и его переворот (как и все числа с теми же суммами симметричных цифр) дают одну и ту же сумму,
+    поэтому на каждом шаге траектории сводятся к уникальным значениям и дальше считаются один раз.
+    Пока значения помещаются в int64, шаги выполняются над массивами чисел, затем — над массивами цифр.
+
     Параметры:
         max_num (int): Верхний предел диапазона чисел для проверки (начиная с 1).
         iters (int): Максимальное количество итераций реверсивного сложения (по умолчанию 50).
@@ -66,12 +285,129 @@ def lychrel_numbers(max_num: int, iters: int = 50) -> list[tuple[int, int]]:
             - Список кортежей (число, количество итераций до палиндрома).
             - Если число не достигает палиндрома в `iters` итераций, оно не включается в список.
     """
-    results = []  # Список чисел, которые стали палиндромами и количество шагов
-    for number in range(1, max_num):
-        new_number = number  # Текущее число, с которым выполняем операции
-        for iteration in range(iters):
-            new_number += int(str(new_number)[::-1])  # Реверсивное сложение
-            if is_palindrome(new_number):  # Проверяем, является ли число палиндромом
-                results.append((number, iteration + 1))  # Записываем число и количество итераций
-                break  # Выходим из цикла, так как палиндром найден
-    return results
+    numbers = np.arange(1, max(max_num, 1), dtype=np.int64)
+    levels = []
+    current = numbers
+    while len(levels) < iters and current.size and current[-1] < _lychrel_int_limit:
+        unique, inverse = np.unique(current + _reverse_numbers(current), return_inverse=True)
+        palindromes = unique == _reverse_numbers(unique)
+        levels.append((inverse, palindromes))
+        current = unique[~palindromes]
+
+    steps = np.zeros(current.size, dtype=np.int64)
+    for chunk in range(0, current.size if len(levels) < iters else 0, _lychrel_chunk):
+        steps[chunk:chunk + _lychrel_chunk] = _reverse_add_steps(current[chunk:chunk + _lychrel_chunk],
+                                                                 iters - len(levels))
+
+    for inverse, palindromes in reversed(levels):
+        unique_steps = palindromes.astype(np.int64)
+        unique_steps[~palindromes] = np.where(steps > 0, steps + 1, 0)
+        steps = unique_steps[inverse]
+
+    found = np.flatnonzero(steps)
+    return list(zip((found + 1).tolist(), steps[found].tolist()))
+
+
+def _reverse_numbers(numbers: np.ndarray) -> np.ndarray:
+    """
+    Переворачивает массив чисел.
+
+    Все числа переворачиваются на общую ширину, после чего лишние нули у коротких чисел отбрасываются делением.
+
+    :param numbers: Массив чисел меньше 10^18.
+    :return: Массив перевёрнутых чисел.
+    """
+    if not numbers.size:
+        return numbers.copy()
+    width = number_len(int(numbers.max()))
+    reversed_nums = np.zeros_like(numbers)
+    rest = numbers
+    for _ in range(width):
+        rest, digit = np.divmod(rest, 10)
+        reversed_nums = reversed_nums * 10 + digit
+    return reversed_nums // 10 ** (width - _digit_lengths(numbers, width))
+
+
+def _reverse_add_steps(numbers: np.ndarray, iters: int) -> np.ndarray:
+    """
+    Выполняет реверсивное сложение сразу для массива чисел.
+
+    Числа хранятся строками массива цифр (младшая цифра первой), отсортированными по длине, поэтому
+    переворот каждой группы строк одной длины — это срез массива. За итерацию строки складываются
+    со своим переворотом, затем распространяются переносы, а ставшие палиндромами строки выбывают.
+
+    :param numbers: Отсортированный массив стартовых чисел.
+    :param iters: Максимальное количество итераций.
+    :return: Количество итераций до палиндрома для каждого числа (0, если палиндром не получен).
+    """
+    width = number_len(int(numbers.max())) + iters + 1
+    digits = _digit_array(numbers, width)
+    lengths = _digit_lengths(numbers, width)
+    active = np.arange(numbers.size)
+    steps = np.zeros(numbers.size, dtype=np.int64)
+
+    for iteration in range(1, iters + 1):
+        for length, start, stop in _length_groups(lengths):
+            digits[start:stop, :length] = digits[start:stop, :length] + digits[start:stop, length - 1::-1]
+
+        # Переносы распространяются по всему массиву сразу; повторов столько, какова самая длинная цепочка девяток
+        used = digits[:, :int(lengths[-1]) + 1]
+        carry = used >= 10
+        while carry.any():
+            used -= 10 * carry.view(np.uint8)
+            used[:, 1:] += carry[:, :-1]
+            carry = used >= 10
+        lengths = lengths + (digits[np.arange(lengths.size), lengths] != 0)
+
+        order = np.argsort(lengths, kind='stable')
+        digits, lengths, active = digits[order], lengths[order], active[order]
+        palindromes = np.zeros(lengths.size, dtype=bool)
+        for length, start, stop in _length_groups(lengths):
+            block = digits[start:stop]
+            palindromes[start:stop] = np.all(block[:, :length // 2] == block[:, length - 1:(length - 1) // 2:-1],
+                                             axis=1)
+
+        steps[active[palindromes]] = iteration
+        keep = ~palindromes
+        digits, lengths, active = digits[keep], lengths[keep], active[keep]
+        if not active.size:
+            break
+    return steps
+
+
+def _length_groups(lengths: np.ndarray) -> Iterator[Tuple[int, int, int]]:
+    """
+    Разбивает отсортированный массив длин на группы равных значений.
+
+    :param lengths: Отсортированный массив длин.
+    :return: Генератор троек (длина, начало группы, конец группы).
+    """
+    bounds = np.flatnonzero(np.diff(lengths)) + 1
+    starts = np.concatenate(([0], bounds))
+    stops = np.concatenate((bounds, [lengths.size]))
+    return zip(lengths[starts].tolist(), starts.tolist(), stops.tolist())
+
+
+def _digit_array(numbers: np.ndarray, width: int) -> np.ndarray:
+    """
+    Раскладывает массив чисел на цифры.
+
+    :param numbers: Массив чисел.
+    :param width: Ширина массива цифр.
+    :return: Массив (len(numbers), width) цифр, младшая цифра первой.
+    """
+    powers = 10 ** np.arange(min(width, 19), dtype=np.int64)
+    digits = np.zeros((numbers.size, width), dtype=np.uint8)
+    digits[:, :powers.size] = numbers[:, None] // powers % 10
+    return digits
+
+
+def _digit_lengths(numbers: np.ndarray, width: int) -> np.ndarray:
+    """
+    Вычисляет количество цифр для массива чисел.
+
+    :param numbers: Массив чисел.
+    :param width: Максимальное количество цифр.
+    :return: Массив длин (для нуля — 1).
+    """
+    return np.searchsorted(10 ** np.arange(1, min(width, 18) + 1, dtype=np.int64), numbers, side='right') + 1
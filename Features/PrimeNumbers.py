@@ -2,7 +2,7 @@ import itertools
 import multiprocessing
 import random
 from collections import Counter
-from typing import Tuple
+from typing import Dict, Tuple
 
 import gmpy2
 import numpy as np
@@ -89,6 +89,10 @@ def prime_num(max_num: int) -> List[int]:
     return primes
 
 
+_small_primes_limit = 1000
+_small_primes = prime_num(_small_primes_limit)
+
+
 def prime_divisor(num: int) -> List[int]:
     """
     Находит все простые делители заданного числа.
@@ -109,6 +113,115 @@ def prime_divisor(num: int) -> List[int]:
     return sorted(div_list)
 
 
+def factorize(num: int) -> Dict[int, int]:
+    """
+    Раскладывает число на простые множители.
+
+    Малые множители отделяются пробным делением, оставшаяся часть — методом Полларда (вариант Брента)
+    с проверкой простоты через gmpy2.
+
+    :param num: Целое число больше нуля.
+    :return: Словарь {простой множитель: степень}, упорядоченный по возрастанию множителей.
+
+    >>> factorize(360)
+    {2: 3, 3: 2, 5: 1}
+    """
+    factors = Counter()
+    for prime in _small_primes:
+        if prime * prime > num:
+            break
+        while num % prime == 0:
+            factors[prime] += 1
+            num //= prime
+
+    stack = [num] if num > 1 else []
+    while stack:
+        current = stack.pop()
+        if current < _small_primes_limit ** 2 or gmpy2.is_prime(current):
+            factors[current] += 1
+            continue
+        root = math.isqrt(current)
+        if root * root == current:
+            stack.extend((root, root))
+            continue
+        divisor = _pollard_brent(current)
+        stack.extend((divisor, current // divisor))
+
+    return dict(sorted(factors.items()))
+
+
+def _pollard_brent(num: int) -> int:
+    """
+    Находит нетривиальный делитель составного числа методом Полларда–Брента.
+
+    :param num: Составное число без малых простых множителей.
+    :return: Нетривиальный делитель num.
+    """
+    while True:
+        y, c, m = random.randrange(1, num), random.randrange(1, num), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % num
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % num
+                    q = q * abs(x - y) % num
+                g = math.gcd(q, num)
+                k += m
+            r *= 2
+        if g == num:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % num
+                g = math.gcd(abs(x - ys), num)
+        if g != num:
+            return g
+
+
+def smallest_prime_factors(max_num: int) -> np.ndarray:
+    """
+    Строит решето наименьших простых делителей для всех n < max_num.
+
+    :param max_num: Верхняя граница (не включается).
+    :return: Массив, где элемент n равен наименьшему простому делителю n (для 0 и 1 — ноль).
+
+    >>> smallest_prime_factors(16).tolist()
+    [0, 0, 2, 3, 2, 5, 2, 7, 2, 3, 2, 11, 2, 13, 2, 3]
+    """
+    factors = np.zeros(max(max_num, 2), dtype=np.int64)
+    for prime in range(2, math.isqrt(max_num - 1) + 1 if max_num > 1 else 2):
+        if not factors[prime]:
+            multiples = factors[prime * prime::prime]
+            multiples[multiples == 0] = prime
+    numbers = np.arange(factors.size, dtype=np.int64)
+    unmarked = (factors == 0) & (numbers > 1)
+    factors[unmarked] = numbers[unmarked]
+    return factors[:max_num]
+
+
+def sieve_factorize(num: int, factors: np.ndarray) -> Dict[int, int]:
+    """
+    Раскладывает число на простые множители по решету наименьших простых делителей.
+
+    :param num: Целое число больше нуля и меньше размера решета.
+    :param factors: Решето smallest_prime_factors.
+    :return: Словарь {простой множитель: степень}, упорядоченный по возрастанию множителей.
+
+    >>> sieve_factorize(360, smallest_prime_factors(400))
+    {2: 3, 3: 2, 5: 1}
+    """
+    result = {}
+    while num > 1:
+        prime = int(factors[num])
+        result[prime] = result.get(prime, 0) + 1
+        num //= prime
+    return result
+
+
 def quadratic_primes(max_b: int, max_a: int) -> Tuple[int, int]:
     """
     Находит максимальное количество простых чисел, получаемых по формуле n^2 + an + b.
@@ -1,48 +1,166 @@
-from typing import List, Tuple
+import bisect
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .Dividers import iter_divisors
+from .PrimeNumbers import factorize
 
 
 def pythagorean_triple_1(num: int) -> List[Tuple[int, int, int]]:
     """
     Находит все Пифагоровы тройки (a, b, c) для заданного периметра.
 
+    Любая тройка записывается как k(m² - n², 2mn, m² + n²) с периметром 2km(m + n), где m > n,
+    m и n взаимно просты и разной чётности. Поэтому перебираются только делители m и t = m + n числа p / 2,
+    и время зависит от количества делителей p / 2, а не от величины периметра.
+
     :param num: Целое число, периметр тройки.
     :return: Список Пифагоровых троек (a, b, c).
 
     >>> pythagorean_triple_1(12)
     [(3, 4, 5)]
+    >>> pythagorean_triple_1(120)
+    [(20, 48, 52), (24, 45, 51), (30, 40, 50)]
     """
+    if num % 2:
+        return []
+    half = num // 2
+    divisors = sorted(iter_divisors(half))
     result = []
-    for a in range(1, num // 3):
-        num_a = num - a
-        a2 = a ** 2
-        for b in range(a + 1, num_a // 2):
-            c = num_a - b
-            if c ** 2 == a2 + b ** 2:
-                result.append((a, b, c))
-                break
-    return result
+    for m in divisors:
+        if m * (m + 1) > half:
+            break
+        for t in divisors[bisect.bisect_right(divisors, m):bisect.bisect_left(divisors, 2 * m)]:
+            n = t - m
+            if t % 2 and half % (m * t) == 0 and math.gcd(m, n) == 1:
+                k = half // (m * t)
+                a, b = k * (m * m - n * n), k * 2 * m * n
+                result.append((min(a, b), max(a, b), k * (m * m + n * n)))
+    return sorted(result)
+
+
+def pythagorean_triples_batch(perimeters: List[int]) -> Dict[int, List[Tuple[int, int, int]]]:
+    """
+    Находит Пифагоровы тройки сразу для набора периметров.
+
+    Каждый периметр обрабатывается тем же перебором делителей m и t = m + n, что и в pythagorean_triple_1,
+    поэтому время зависит от числа периметров и их делителей, а не от величины максимального периметра.
+
+    :param perimeters: Список периметров.
+    :return: Словарь {периметр: список троек (a, b, c)}.
+
+    >>> pythagorean_triples_batch([12, 30, 31])
+    {12: [(3, 4, 5)], 30: [(5, 12, 13)], 31: []}
+    """
+    return {perimeter: pythagorean_triple_1(perimeter) for perimeter in sorted(set(perimeters))}
 
 
 def pythagorean_triple_2(num: int) -> List[Tuple[int, int]]:
     """
     Находит все Пифагоровы тройки (a, b) для заданного c.
 
+    Представления c² = a² + b² строятся из разложения c на простые множители через sum_of_two_squares,
+    поэтому время определяется разложением c, а не его величиной.
+
     :param num: Целое число, значение c.
     :return: Список пар (a, b) для Пифагоровых тройек.
 
     >>> pythagorean_triple_2(25)
-    [(7, 24)]
+    [(7, 24), (15, 20)]
+    """
+    factors = {prime: power * 2 for prime, power in factorize(num).items()}
+    return [(a, b) for a, b in _two_squares(factors) if a > 0]
+
+
+def sum_of_two_squares(num: int) -> List[Tuple[int, int]]:
+    """
+    Находит все представления числа в виде суммы двух квадратов num = a² + b², 0 ≤ a ≤ b.
+
+    Для каждого простого p ≡ 1 (mod 4) разложение p = x² + y² находится методом Эрмита–Серре,
+    после чего представления num получаются перемножением гауссовых чисел (x ± iy) по всем множителям.
+
+    :param num: Целое число больше нуля.
+    :return: Отсортированный список пар (a, b).
+
+    >>> sum_of_two_squares(325)
+    [(1, 18), (6, 17), (10, 15)]
+    """
+    return _two_squares(factorize(num))
+
+
+def _two_squares(factors: Dict[int, int]) -> List[Tuple[int, int]]:
+    """
+    Строит представления суммой двух квадратов по разложению на простые множители.
+
+    :param factors: Словарь {простой множитель: степень}.
+    :return: Отсортированный список пар (a, b), 0 ≤ a ≤ b.
     """
-    num_list = []
-    maxi = num
-    num = int(num ** 0.5)
-    for a in range(1, num // 2):
-        a2 = a ** 2
-        for b in range(a, num + 1):
-            if a2 + b ** 2 == maxi:
-                num_list.append((a, b))
-                break
-    return num_list
+    # Гауссовы числа хранятся парами (вещественная часть, мнимая часть)
+    products = [(1, 0)]
+    for prime, power in factors.items():
+        if prime == 2:
+            two_power = _gaussian_pow((1, 1), power, (1, -1), 0)
+            products = [_gaussian_mul(z, two_power) for z in products]
+        elif prime % 4 == 3:
+            if power % 2:
+                return []
+            scale = prime ** (power // 2)
+            products = [(re * scale, im * scale) for re, im in products]
+        else:
+            x, y = _prime_two_squares(prime)
+            choices = [_gaussian_pow((x, y), k, (x, -y), power - k) for k in range(power + 1)]
+            products = [_gaussian_mul(z, choice) for z in products for choice in choices]
+
+    return sorted({tuple(sorted((abs(re), abs(im)))) for re, im in products})
+
+
+def _prime_two_squares(prime: int) -> Tuple[int, int]:
+    """
+    Раскладывает простое p ≡ 1 (mod 4) в сумму двух квадратов методом Эрмита–Серре.
+
+    :param prime: Простое число, p ≡ 1 (mod 4).
+    :return: Пара (x, y), x² + y² = p.
+    """
+    non_residue = 2
+    while pow(non_residue, (prime - 1) // 2, prime) != prime - 1:
+        non_residue += 1
+    a, b = prime, pow(non_residue, (prime - 1) // 4, prime)
+    limit = math.isqrt(prime)
+    while b > limit:
+        a, b = b, a % b
+    return b, math.isqrt(prime - b * b)
+
+
+def _gaussian_mul(first: Tuple[int, int], second: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    Перемножает два гауссовых числа.
+
+    :param first: Пара (вещественная часть, мнимая часть).
+    :param second: Пара (вещественная часть, мнимая часть).
+    :return: Произведение в виде пары.
+    """
+    return first[0] * second[0] - first[1] * second[1], first[0] * second[1] + first[1] * second[0]
+
+
+def _gaussian_pow(base: Tuple[int, int], power: int, conjugate: Tuple[int, int],
+                  conjugate_power: int) -> Tuple[int, int]:
+    """
+    Вычисляет base^power * conjugate^conjugate_power для гауссовых чисел.
+
+    :param base: Гауссово число.
+    :param power: Степень base.
+    :param conjugate: Сопряжённое гауссово число.
+    :param conjugate_power: Степень conjugate.
+    :return: Произведение в виде пары.
+    """
+    result = (1, 0)
+    for _ in range(power):
+        result = _gaussian_mul(result, base)
+    for _ in range(conjugate_power):
+        result = _gaussian_mul(result, conjugate)
+    return result
 
 
 def whole_right_triangles(maxim: int) -> Tuple[List[Tuple[int, int, int]], int, int]:
@@ -50,6 +168,9 @@ def whole_right_triangles(maxim: int) -> Tuple[List[Tuple[int, int, int]], int,
     Находит значение p, дающее максимальное количество Пифагоровых троек
     для всех p ≤ maxim, а также возвращает количество найденных троек.
 
+    Примитивные тройки строятся формулой Евклида (m > n, m и n взаимно просты и разной чётности),
+    после чего все кратные их периметров подсчитываются одним вызовом np.bincount.
+
     :param maxim: Целое число, максимальное значение периметра p для поиска.
     :return: Кортеж, содержащий:
         - список найденных Пифагоровых троек для максимального p,
@@ -58,8 +179,56 @@ def whole_right_triangles(maxim: int) -> Tuple[List[Tuple[int, int, int]], int,
 
     >>> whole_right_triangles(12)
     ([(3, 4, 5)], 1, 12)
+    >>> whole_right_triangles(1000)[1:]
+    (8, 840)
+    """
+    perimeters, legs_a, legs_b = primitive_triples(maxim)
+    if not perimeters.size:
+        return [], 0, 0
+
+    indices, multipliers = _perimeter_multiples(perimeters, maxim)
+    counts = np.bincount(perimeters[indices] * multipliers, minlength=maxim + 1)
+
+    p = int(np.argmax(counts))
+    mask = p % perimeters == 0
+    scale = p // perimeters[mask]
+    a, b = legs_a[mask] * scale, legs_b[mask] * scale
+    result = sorted(zip(np.minimum(a, b).tolist(), np.maximum(a, b).tolist(), (p - a - b).tolist()))
+    return result, len(result), p
+
+
+def primitive_triples(maxim: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Строит все примитивные Пифагоровы тройки с периметром не больше maxim по формуле Евклида:
+    a = m² - n², b = 2mn, c = m² + n², p = 2m(m + n).
+
+    :param maxim: Максимальный периметр.
+    :return: Массивы периметров и катетов a и b примитивных троек.
+    """
+    perimeters, legs_a, legs_b = [], [], []
+    m = 2
+    while 2 * m * (m + 1) <= maxim:
+        n = np.arange(1 + m % 2, m, 2, dtype=np.int64)
+        n = n[(np.gcd(n, m) == 1) & (2 * m * (m + n) <= maxim)]
+        perimeters.append(2 * m * (m + n))
+        legs_a.append(m * m - n * n)
+        legs_b.append(2 * m * n)
+        m += 1
+
+    if not perimeters:
+        return tuple(np.zeros(0, dtype=np.int64) for _ in range(3))
+    return np.concatenate(perimeters), np.concatenate(legs_a), np.concatenate(legs_b)
+
+
+def _perimeter_multiples(perimeters: np.ndarray, maxim: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Строит все кратные k * p0 ≤ maxim для каждого примитивного периметра одним массивом.
+
+    :param perimeters: Массив примитивных периметров.
+    :param maxim: Максимальный периметр.
+    :return: Массивы индексов примитивных троек и множителей k.
     """
-    result = max(map(pythagorean_triple_1, range(1, maxim + 1)), key=len)
-    length = len(result)
-    p = sum(result[0]) if result else 0
-    return result, length, p
+    repeats = maxim // perimeters
+    offsets = np.repeat(np.cumsum(repeats) - repeats, repeats)
+    multipliers = np.arange(1, offsets.size + 1, dtype=np.int64) - offsets
+    return np.repeat(np.arange(perimeters.size), repeats), multipliers
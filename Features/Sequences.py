@@ -1,7 +1,13 @@
 import itertools
+from typing import Iterator, Optional, Sequence
+
+import gmpy2
+import numpy as np
 
 from .my_utils import *
 
+from .Dividers import divisor_count_sieve
+
 from .Figure_numbers import *
 
 
@@ -35,99 +41,226 @@ def triangular_numbers(max_num: int) -> List[int]:
     return triangular_nums[1:-1]
 
 
+def highly_divisible_triangular(min_divisors: int) -> tuple[int, int, int]:
+    """
+    Находит первое треугольное число, у которого делителей больше заданного количества.
+
+    Так как n и n + 1 взаимно просты, d(T_n) = d(n / 2) * d(n + 1) для чётного n и d(n) * d((n + 1) / 2)
+    для нечётного. Количества делителей берутся из решета, которое удваивается, пока ответ не найден,
+    а все кандидаты текущего диапазона проверяются одной векторной операцией.
+
+    :param min_divisors: Количество делителей, которое нужно превзойти.
+    :return: Треугольное число, его номер n и количество его делителей.
+
+    >>> highly_divisible_triangular(500)
+    (76576500, 12375, 576)
+    """
+    limit = 1024
+    while True:
+        counts = divisor_count_sieve(limit + 1)
+        n = np.arange(1, limit, dtype=np.int64)
+        even = n % 2 == 0
+        triangle_counts = counts[np.where(even, n // 2, n)] * counts[np.where(even, n + 1, (n + 1) // 2)]
+        found = np.flatnonzero(triangle_counts > min_divisors)
+        if found.size:
+            index = int(n[found[0]])
+            return index * (index + 1) // 2, index, int(triangle_counts[found[0]])
+        limit *= 2
+
+
 def fibonacci(max_num: int) -> List[int]:
     """
     Находит числа Фибоначчи до заданного числа.
 
     :param max_num: Целое число, верхняя граница для чисел Фибоначчи.
     :return: Список чисел Фибоначчи.
+
+    >>> fibonacci(20)
+    [0, 1, 1, 2, 3, 5, 8, 13]
     """
-    fib_sequence = [0, 1]
-    while fib_sequence[-1] <= max_num:
-        fib_sequence.append(fib_sequence[-1] + fib_sequence[-2])
-    if fib_sequence[-1] >= max_num:
-        fib_sequence.pop()
-    return fib_sequence
+    return list(itertools.takewhile(lambda number: number <= max_num, iter_linear_recurrence((1, 1), (0, 1))))
 
 
-def count_triangular_words(words: List[str]) -> int:
+def fibonacci_number(index: int, mod: Optional[int] = None) -> int:
     """
-    Считает количество треугольных слов в заданном списке.
+    Вычисляет n-е число Фибоначчи быстрым удвоением: F(2k) = F(k)·(2F(k + 1) − F(k)), F(2k + 1) = F(k)² + F(k + 1)².
 
-    :param words: Список слов.
-    :return: Количество треугольных слов.
+    Требуется O(log n) умножений; точные вычисления ведутся в gmpy2.mpz, модульные — с приведением на каждом шаге.
 
+    :param index: Номер числа (F(0) = 0, F(1) = 1).
+    :param mod: Модуль; если не задан, число вычисляется точно.
+    :return: F(index) или F(index) по модулю mod.
+
+    >>> fibonacci_number(100)
+    354224848179261915075
+    >>> fibonacci_number(10 ** 18, 10 ** 9)
+    560546875
+    """
+    current, following = (0, 1) if mod else (gmpy2.mpz(0), gmpy2.mpz(1))
+    for bit in bin(index)[2:]:
+        double = current * (2 * following - current)
+        double_next = current * current + following * following
+        if mod:
+            double, double_next = double % mod, double_next % mod
+        if bit == '1':
+            current, following = double_next, double + double_next
+            if mod:
+                following %= mod
+        else:
+            current, following = double, double_next
+    return int(current)
+
+
+def even_fibonacci_sum(max_num: int) -> int:
     """
+    Считает сумму чётных чисел Фибоначчи, не превосходящих max_num.
 
-    # Мемоизация треугольных чисел
-    def memoize_triangular_numbers(func):
-        def wrapper(maxi):
-            return func(maxi)
+    Чётным является каждое третье число Фибоначчи, и они образуют рекуррентность E(k) = 4E(k − 1) + E(k − 2),
+    поэтому перебираются только чётные члены.
 
-        wrapper.triangular_nums = [1]  # Начальное треугольное число
-        wrapper.n = 2  # Начинаем с n=2
-        return wrapper
+    :param max_num: Верхняя граница.
+    :return: Сумма чётных чисел Фибоначчи.
 
-    @memoize_triangular_numbers
-    def triangular_numbers(maxi):
-        while triangular_numbers.triangular_nums[-1] < maxi:
-            next_num = triangular_numbers.n * (triangular_numbers.n + 1) // 2
-            triangular_numbers.triangular_nums.append(next_num)
-            triangular_numbers.n += 1
-        return triangular_numbers.triangular_nums
+    >>> even_fibonacci_sum(4 * 10 ** 6)
+    4613732
+    """
+    return sum(itertools.takewhile(lambda number: number <= max_num, iter_linear_recurrence((4, 1), (0, 2))))
 
-    def word_value(word: str) -> int:
-        """Возвращает числовое значение слова."""
-        return sum(ord(c) - ord('A') + 1 for c in word)
 
-    def is_triangular_word(word: str) -> bool:
-        """Проверяет, является ли значение слова треугольным."""
-        word_val = word_value(word)
-        if word_val > triangular_numbers.triangular_nums[-1]:
-            triangular_numbers(word_val)
-        return word_val in triangular_numbers.triangular_nums
+def linear_recurrence(coefficients: Sequence[int], initial: Sequence[int], index: int,
+                      mod: Optional[int] = None) -> int:
+    """
+    Вычисляет член линейной рекуррентности a(n) = c1·a(n − 1) + ... + ck·a(n − k) методом Китамасы.
 
-    triangular_word_count = sum(1 for word in words if is_triangular_word(word))
-    return triangular_word_count
+    Многочлен x^n приводится по модулю характеристического многочлена x^k − c1·x^(k − 1) − ... − ck бинарным
+    возведением в степень; его коэффициенты дают a(n) как комбинацию начальных значений.
+    Время O(k² log n) вместо O(k³ log n) для возведения матрицы в степень.
 
+    :param coefficients: Коэффициенты c1, ..., ck.
+    :param initial: Начальные значения a(0), ..., a(k − 1).
+    :param index: Номер члена.
+    :param mod: Модуль; если не задан, член вычисляется точно.
+    :return: a(index) или a(index) по модулю mod.
 
-def triangular_pentagonal_hexagonal(max_id: int) -> List[int]:
+    >>> linear_recurrence((1, 1, 1), (0, 0, 1), 37)
+    1132436852
     """
-    Находит шестиугольные числа, которые также являются пентагональными.
+    order = len(coefficients)
+    if index < order:
+        return initial[index] % mod if mod else initial[index]
 
-    :param max_id: Максимальное количество найденных чисел.
-    :return: Список шестиугольных чисел, которые являются пентагональными.
+    result = _reduce_polynomial([1], coefficients, mod)
+    power = _reduce_polynomial([0, 1], coefficients, mod)
+    while index:
+        if index & 1:
+            result = _multiply_polynomials(result, power, coefficients, mod)
+        power = _multiply_polynomials(power, power, coefficients, mod)
+        index >>= 1
+
+    value = sum(weight * start for weight, start in zip(result, initial))
+    return value % mod if mod else value
+
+
+def iter_linear_recurrence(coefficients: Sequence[int], initial: Sequence[int], start: int = 0,
+                           stop: Optional[int] = None, mod: Optional[int] = None) -> Iterator[int]:
     """
-    if max_id > 66:
-        max_id = 66
+    Лениво перечисляет члены линейной рекуррентности с номерами из [start, stop).
 
-    def hexagonal_number(n: int) -> int:
-        """Возвращает n-е шестиугольное число."""
-        return n * (2 * n - 1)
+    Первые k членов окна вычисляются методом Китамасы, поэтому перечисление может начинаться с любого номера,
+    дальше каждый член получается из k предыдущих.
 
-    def estimate_growth_rate(hexagonal_numbers_list: List[int]) -> float:
-        """Оценивает скорость роста шестиугольных чисел."""
-        return hexagonal_numbers_list[-1] / hexagonal_numbers_list[-2] if len(hexagonal_numbers_list) > 1 else 1.0
+    :param coefficients: Коэффициенты c1, ..., ck.
+    :param initial: Начальные значения a(0), ..., a(k − 1).
+    :param start: Номер первого члена.
+    :param stop: Номер, на котором перечисление останавливается; без него генератор бесконечен.
+    :param mod: Модуль; если не задан, члены вычисляются точно.
+    :return: Генератор членов рекуррентности.
 
-    step_increment = 9
-    hexagonal_numbers = []
-    current_hexagonal = 6
+    >>> list(iter_linear_recurrence((1, 1), (0, 1), 10, 15))
+    [55, 89, 144, 233, 377]
+    """
+    window = [linear_recurrence(coefficients, initial, start + offset, mod) for offset in range(len(coefficients))]
+    for _ in itertools.count(start) if stop is None else range(start, stop):
+        yield window[0]
+        following = sum(coefficient * term for coefficient, term in zip(coefficients, reversed(window)))
+        window = window[1:] + [following % mod if mod else following]
+
+
+def _multiply_polynomials(first: List[int], second: List[int], coefficients: Sequence[int],
+                          mod: Optional[int]) -> List[int]:
+    """
+    Перемножает многочлены и приводит произведение по модулю характеристического многочлена.
+
+    :param first: Коэффициенты первого многочлена по возрастанию степеней.
+    :param second: Коэффициенты второго многочлена по возрастанию степеней.
+    :param coefficients: Коэффициенты рекуррентности c1, ..., ck.
+    :param mod: Модуль или None.
+    :return: Приведённый многочлен степени меньше k.
+    """
+    product = [0] * (len(first) + len(second) - 1)
+    for position, value in enumerate(first):
+        if value:
+            for offset, other in enumerate(second):
+                product[position + offset] += value * other
+    return _reduce_polynomial(product, coefficients, mod)
 
-    while len(hexagonal_numbers) < max_id:
-        if is_pentagonal(current_hexagonal):
-            hexagonal_numbers.append(current_hexagonal)
 
-            if len(hexagonal_numbers) > 1:
-                growth_rate = estimate_growth_rate(hexagonal_numbers) - 1
-                suspect = current_hexagonal * growth_rate
-                n = int((1 + (1 + 8 * suspect) ** 0.5) / 4)
-                previous_hexagonal = hexagonal_number(n - 1)
-                current_hexagonal = hexagonal_number(n)
-                step_increment = current_hexagonal - previous_hexagonal + 4
-                continue
+def _reduce_polynomial(polynomial: List[int], coefficients: Sequence[int], mod: Optional[int]) -> List[int]:
+    """
+    Приводит многочлен по модулю x^k − c1·x^(k − 1) − ... − ck, заменяя x^k на c1·x^(k − 1) + ... + ck.
 
-        current_hexagonal, step_increment = next_hexagonal(current_hexagonal, step_increment)
+    :param polynomial: Коэффициенты многочлена по возрастанию степеней.
+    :param coefficients: Коэффициенты рекуррентности c1, ..., ck.
+    :param mod: Модуль или None.
+    :return: Коэффициенты многочлена степени меньше k (ровно k штук).
+    """
+    order = len(coefficients)
+    polynomial = polynomial + [0] * max(0, order - len(polynomial))
+    for degree in range(len(polynomial) - 1, order - 1, -1):
+        top = polynomial[degree] % mod if mod else polynomial[degree]
+        if top:
+            for shift, coefficient in enumerate(coefficients, 1):
+                polynomial[degree - shift] += top * coefficient
+    reduced = polynomial[:order]
+    return [value % mod for value in reduced] if mod else reduced
 
+
+def count_triangular_words(words: List[str]) -> int:
+    """
+    Считает количество треугольных слов в заданном списке.
+
+    Значения всех слов считаются одной векторной операцией word_values,
+    треугольность проверяется точным целочисленным тестом is_polygonal.
+
+    :param words: Список слов.
+    :return: Количество треугольных слов.
+
+    >>> count_triangular_words(['SKY', 'A', 'B', 'ABC'])
+    3
+    """
+    return int(is_polygonal(3, word_values(words)).sum())
+
+
+def triangular_pentagonal_hexagonal(max_id: int) -> List[int]:
+    """
+    Находит шестиугольные числа, которые также являются пентагональными.
+
+    Каждое шестиугольное число треугольное, поэтому достаточно решить H(n) = P(m). Замена x = 4n − 1, y = 6m − 1
+    сводит его к уравнению типа Пелля y² − 3x² = −2, решения которого получаются умножением на 97 + 56√3.
+    Отсюда номера шестиугольных чисел связаны линейной рекуррентностью n(k + 1) = 194·n(k) − n(k − 1) − 48,
+    и числа строятся сразу, точно в целых числах, без ограничения на их величину.
+
+    :param max_id: Максимальное количество найденных чисел.
+    :return: Список шестиугольных чисел, которые являются пентагональными.
+
+    >>> triangular_pentagonal_hexagonal(3)
+    [1, 40755, 1533776805]
+    """
+    hexagonal_numbers = []
+    index, following = 1, 143
+    while len(hexagonal_numbers) < max_id:
+        hexagonal_numbers.append(polygonal_number(6, index))
+        index, following = following, 194 * following - index - 48
     return hexagonal_numbers
 
 
@@ -135,81 +268,93 @@ def cyclic_figur_nums(n: int) -> list[int] | None:
     """
     Находит набор циклических многоугольных чисел заданной длины.
 
+    Все n-значные числа каждого семейства (от треугольных до восьмиугольных) строятся один раз и
+    раскладываются по корзинам по первой половине цифр. Цикл ищется обходом в глубину по состояниям
+    (использованные семейства, последняя половина цифр), начиная с восьмиугольных чисел как самого редкого
+    семейства; состояния, из которых цикл не замыкается, запоминаются и повторно не обходятся.
+
     Параметры:
-        n (int): Количество используемых многоугольных чисел.
+        n (int): Количество знаков в числах.
 
     Возвращаемое значение:
         list[int]| None:
-            - Список найденных циклических чисел.
-            - Если n нечетное, возвращает None.
+            - Список найденных циклических чисел, начиная с восьмиугольного.
+            - Если n нечетное или цикл не найден, возвращает None.
+
+    >>> cyclic_figur_nums(4)
+    [1281, 8128, 2882, 8256, 5625, 2512]
     """
     # Проверка на четность, так как алгоритм требует парного разбиения числа
     if n % 2 != 0:
         return None
 
-    # Определение функций для поиска многоугольных чисел
-    funcs = [
-        (nearest_triangle_positive, next_triangle),
-        (nearest_square_positive, next_square),
-        (nearest_pentagonal_positive, next_pentagonal),
-        (nearest_hexagonal_positive, next_hexagonal),
-        (nearest_heptagonal_positive, next_heptagonal),
-        (nearest_octagonal_positive, next_octagonal),
-    ]
-
-    half_len = n // 2  # Половина длины числа
-    end = 10 ** n  # Верхний предел поиска
-    start = end / 10  # Нижний предел поиска
-
-    # Перебираем все возможные комбинации функций
-    for funcs_comb in itertools.permutations(funcs):
-        curr_num, step = funcs[0][0](start)  # Начальное число
-        parameters = [(curr_num, end, step)]  # Список текущих параметров поиска
-
-        while True:
-            not_zero = False
-            curr_num, curr_max, step = parameters[-1]  # Текущие параметры
-
-            # Если число превысило предел, откатываемся на предыдущий шаг
-            if curr_num >= curr_max:
-                parameters.pop()
-                if not parameters:
-                    break  # Завершаем поиск, если нет возможных значений
-                curr_num, curr_max, step = parameters[-1]
-                curr_nearest_func, curr_next_func = funcs_comb[len(parameters) - 1]
-                curr_num, step = curr_next_func(curr_num, step)
-                parameters[-1] = (curr_num, curr_max, step)
-                continue
-
-            # Следующая функция для проверки
-            next_nearest_func = funcs_comb[len(parameters)][0]
-            curr_digits = get_digits(curr_num)  # Получаем цифры текущего числа
-
-            # Проверяем, содержит ли число ненулевые значения в нужной половине
-            if 0 not in curr_digits[half_len:-1]:
-                # Если последний элемент, проверяем замыкание цикла
-                if len(parameters) == len(funcs) - 1:
-                    curr_new = massive_concatenate(curr_digits[half_len:] + get_digits(parameters[0][0])[:half_len])
-                    if next_nearest_func(curr_new)[0] == curr_new:
-                        return [x[0] for x in parameters] + [curr_new]
-                    else:
-                        curr_nearest_func, curr_next_func = funcs_comb[len(parameters) - 1]
-                        curr_num, step = curr_next_func(curr_num, step)
-                        parameters[-1] = (curr_num, curr_max, step)
+    half = 10 ** (n // 2)
+    buckets = [_prefix_buckets(sides, n) for sides in _cyclic_sides]
+    full_mask = (1 << len(buckets)) - 1
+    start = len(buckets) - 1
+
+    for prefix, first_numbers in buckets[start].items():
+        dead_states = set()
+        path = []
+
+        def search(mask: int, last: int) -> tuple[bool, bool]:
+            """
+            Достраивает цикл из состояния (mask, last), замыкая его на prefix.
+
+            :return: Признак найденного цикла и признак того, что неудача зависела от текущего пути.
+            """
+            if mask == full_mask:
+                return last == prefix, False
+            if (mask, last) in dead_states:
+                return False, False
+            path_dependent = False
+            for family, bucket in enumerate(buckets):
+                if mask >> family & 1:
+                    continue
+                for number in bucket.get(last, ()):
+                    # Одно число не может представлять два семейства
+                    if number in path:
+                        path_dependent = True
                         continue
+                    path.append(number)
+                    found, child_dependent = search(mask | 1 << family, number % half)
+                    if found:
+                        return True, False
+                    path.pop()
+                    path_dependent |= child_dependent
+            # Неудача, вызванная повтором числа здесь или в любом потомке, зависит от пути и не запоминается
+            if not path_dependent:
+                dead_states.add((mask, last))
+            return False, path_dependent
+
+        for number in first_numbers:
+            path = [number]
+            if search(1 << start, number % half)[0]:
+                return path
 
-                # Формируем новое число для следующего шага
-                sus_new = massive_concatenate(curr_digits[half_len:] + [0] * half_len)
-                curr_new, new_step = next_nearest_func(sus_new)
-                new_max = sus_new + 10 ** half_len
-                not_zero = True
-
-            # Если не удалось найти подходящее число, откатываемся назад
-            if not not_zero or curr_new >= new_max:
-                curr_nearest_func, curr_next_func = funcs_comb[len(parameters) - 1]
-                curr_num, step = curr_next_func(curr_num, step)
-                parameters[-1] = (curr_num, curr_max, step)
-                continue
-
-            # Добавляем новое число в параметры
-            parameters.append((curr_new, new_max, new_step))
+    return None
+
+
+# Количества сторон многоугольников, из которых составляется цикл
+_cyclic_sides = (3, 4, 5, 6, 7, 8)
+
+
+def _prefix_buckets(sides: int, n: int) -> dict[int, list[int]]:
+    """
+    Раскладывает n-значные s-угольные числа по первой половине их цифр.
+
+    Числа, вторая половина которых начинается с нуля, пропускаются: они не могут продолжить цикл.
+
+    :param sides: Количество сторон многоугольника.
+    :param n: Количество знаков (чётное).
+    :return: Словарь: первая половина цифр -> список чисел.
+    """
+    half = 10 ** (n // 2)
+    first, _ = polygonal_root(sides, 10 ** (n - 1) - 1)
+    last, _ = polygonal_root(sides, 10 ** n - 1)
+    buckets = {}
+    for index in range(first + 1, last + 1):
+        number = polygonal_number(sides, index)
+        if number % half >= half // 10:
+            buckets.setdefault(number // half, []).append(number)
+    return buckets
@@ -3,6 +3,9 @@ import time
 from functools import reduce
 from typing import List, Callable, Optional
 
+import gmpy2
+import numpy as np
+
 
 def massive_concatenate(massive: List[int]) -> int:
     """
@@ -161,3 +164,72 @@ def logarithmic_partition(start: int, end: int, n: int) -> List[int]:
         partition_points.append(point)
 
     return partition_points
+
+
+def word_values(words: List[str]) -> np.ndarray:
+    """
+    Вычисляет значения слов как сумму значений букв (A=1, B=2 и т.д.) сразу для всего списка.
+
+    Все слова склеиваются в один буфер кодов символов, суммы по словам считаются одним np.add.reduceat.
+
+    :param words: Список слов
+    :return: Массив значений слов в порядке списка
+    """
+    lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+    text = ''.join(words)
+    if text.isascii():
+        codes = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    else:
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
+    values = np.zeros(len(words), dtype=np.int64)
+    not_empty = lengths > 0
+    if codes.size:
+        starts = np.cumsum(lengths) - lengths
+        values[not_empty] = np.add.reduceat(codes, starts[not_empty], dtype=np.int64)
+    return values - (ord('A') - 1) * lengths
+
+
+def digit_string(number: int, base: int = 10) -> str:
+    """
+    Переводит число в строку цифр без ограничения на длину.
+
+    Перевод выполняется gmpy2.digits субквадратичным алгоритмом «разделяй и властвуй»,
+    поэтому ограничение CPython в 4300 цифр на str(int) не действует.
+
+    :param number: Целое число (знак отбрасывается)
+    :param base: Основание системы счисления (от 2 до 62)
+    :return: Строка цифр числа
+    """
+    return gmpy2.digits(abs(gmpy2.mpz(number)), base)
+
+
+def digit_histogram(number: int) -> np.ndarray:
+    """
+    Считает, сколько раз каждая цифра встречается в десятичной записи числа.
+
+    :param number: Целое число
+    :return: Массив из 10 элементов, где элемент d равен количеству цифр d
+    """
+    codes = np.frombuffer(digit_string(number).encode('ascii'), dtype=np.uint8)
+    return np.bincount(codes - ord('0'), minlength=10)
+
+
+def digit_sum(number: int) -> int:
+    """
+    Считает сумму цифр десятичной записи числа.
+
+    :param number: Целое число
+    :return: Сумма цифр
+    """
+    return int(digit_histogram(number) @ np.arange(10))
+
+
+def digit_count(number: int) -> int:
+    """
+    Считает количество цифр десятичной записи числа.
+
+    :param number: Целое число
+    :return: Количество цифр
+    """
+    return len(digit_string(number))
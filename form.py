@@ -73,7 +73,7 @@ input_library_with_nums = {
                           "Находит \"a, b, c\", если известно \"a + b + c\"."),
     "Тройка Пифагора 2": ("Ints", Pythagorean.pythagorean_triple_2,
                           (num_request,), "a, b = {reply}.",
-                          "Находит \"a, b\", если известно \"c^2\"."),
+                          "Находит \"a, b\", если известно \"c\"."),
     "Целые прямоугольные треугольники": ("Ints", Pythagorean.whole_right_triangles,
                                          (max_num_request,),
                                          "Результат: {reply[0]}, Длинна: {reply[1]}, Периметр: {reply[2]}.\n",
@@ -98,6 +98,12 @@ input_library_with_nums = {
     "Дружественный числа": ("Ints", Dividers.find_friendly_numbers, (max_num_request,),
                             "Дружественный числа до {user_inputs[0]}:",
                             "Находит дружественный числа до заданного числа."),
+    "Общительные числа": ("Ints", Dividers.sociable_chain, (max_num_request,),
+                          "Длинна цепочки: {reply[0]}, цепочка общительных чисел до {user_inputs[0]}:",
+                          "Находит самую длинную цепочку общительных чисел, все члены которой меньше заданного."),
+    "Неизбыточные суммы": ("Ints", Dividers.non_abundant_sums, (max_num_request,),
+                           "Cумма чисел: {reply[0]}, числа до {user_inputs[0]}, не являющиеся суммой двух избыточных:",
+                           "Находит числа, которые нельзя записать как сумму двух избыточных чисел."),
     "Проверка делителей":
         ("Op_coListInt", Dividers.check_divisors,
          ['Оператор "<" или ">" ?:', list_request, "Введите количество делителей:"],
@@ -111,10 +117,22 @@ input_library_with_nums = {
                           (max_num_request,),
                           "Треугольные числа до {user_inputs[0]}:",
                           "Находит треугольные числа до указанного \"x\"."),
+    "Делимые треугольные числа": ("Ints", Sequences.highly_divisible_triangular,
+                                  ("Введите количество делителей:",),
+                                  "Треугольное число: {reply[0]}, номер: {reply[1]}, делителей: {reply[2]}.",
+                                  "Находит первое треугольное число, у которого делителей больше заданного."),
     "Фибоначчи": ("Ints", Sequences.fibonacci,
                   (max_num_request,),
                   "Числа Фибоначчи до {user_inputs[0]}:",
                   "Поиск чисел Фибоначчи."),
+    "Число Фибоначчи по модулю": ("Ints", Sequences.fibonacci_number,
+                                  ("Введите номер числа:", "Введите модуль:"),
+                                  "F({user_inputs[0]}) mod {user_inputs[1]} = {reply}.",
+                                  "Вычисляет n-е число Фибоначчи по модулю быстрым удвоением."),
+    "Сумма чётных Фибоначчи": ("Ints", Sequences.even_fibonacci_sum,
+                               (max_num_request,),
+                               "Сумма чётных чисел Фибоначчи до {user_inputs[0]}: {reply}.",
+                               "Считает сумму чётных чисел Фибоначчи, не превосходящих \"x\"."),
     "Закодированные треугольные числа":
         ("ListStr", Sequences.count_triangular_words, ("Введите слова через запятую:",),
          "Количество треугольных слов:",
@@ -197,11 +215,19 @@ input_library_with_nums = {
                    (max_num_request, min_num_request),
                    "Числа-палиндромы от {user_inputs[1]} до {user_inputs[0]}:",
                    "Вычисляет все числа-палиндромы до указанного \"x\"."),
+    "Количество палиндромов": ("MoreLess", Palindromes.count_palindromes,
+                               (max_num_request, min_num_request),
+                               "Количество палиндромов от {user_inputs[1]} до {user_inputs[0]}: {reply}.",
+                               "Считает числа-палиндромы в диапазоне без их перебора."),
     "Палиндромы по обоим основаниям":
         ("MoreLess", Palindromes.double_base_palindromes,
          (max_num_request, min_num_request),
          "Палиндромы по обоим основаниям от {user_inputs[1]} до {user_inputs[0]}:",
          "Вычисляет палиндромы, которые являются палиндромами в десятичной и в двоичной системах счисления."),
+    "Палиндром из произведения":
+        ("Ints", Palindromes.largest_palindrome_product, ("Введите количество знаков множителей:",),
+         "Палиндром: {reply[0]} = {reply[1]} * {reply[2]}.",
+         "Находит наибольший палиндром, являющийся произведением двух чисел с заданным количеством знаков."),
     "Числа Личреля":
         ("Ints",
          Palindromes.lychrel_numbers, (max_num_request, "Введите количество итерация для проверки:"),
@@ -216,13 +242,19 @@ input_library_with_nums = {
                     "Cпособы составить {user_inputs[1]}:",
                     "Вычисляет количество различных способов составить определённую сумму\n"
                     "с использованием неограниченного количества монет номиналом \"x\"."),
+    "Разбиения числа": ("Ints", NumberOperations.partition_count, (num_request,),
+                        "Количество разбиений числа {user_inputs[0]}: {reply}.",
+                        "Считает количество способов записать число в виде суммы натуральных слагаемых."),
+    "Делимость разбиений": ("Ints", NumberOperations.first_partition_divisible, ("Введите делитель:",),
+                            "Наименьшее n, при котором p(n) делится на {user_inputs[0]}: {reply}.",
+                            "Находит первое число, количество разбиений которого делится на заданное число."),
     "Пятые степени цифр": ("Ints", NumberOperations.sum_fifth_powers_digits, (num_request,),
                            "Чисела, которые могут быть записаны в виде суммы пятых степеней их цифр:",
                            "Вычисляет сумму всех чисел, которые равны сумме пятых степеней своих цифр."),
     "Различные степени": ("MoreLess", NumberOperations.distinct_powers_count,
                           (max_num_request, min_num_request),
-                          "Последовательность: {reply[0]}.\nДлинна: {reply[1]}.",
-                          "Находит последовательность a**b для 2 <= a <= 100 и 2 <= b <= 100."),
+                          "Количество различных степеней: {reply}.",
+                          "Считает количество различных значений a**b, где a и b лежат в заданных границах."),
     "Дробь":
         ("Ints", NumberOperations.fraction,
          (num_request,),
@@ -244,6 +276,11 @@ input_library_with_nums = {
          (max_num_request, min_num_request, "Укажите день недели (Понедельник - 1, Вторник - 2 и т.д.):"),
          "Всего воскресений на 1 числа месяцев с {user_inputs[1]} до {user_inputs[0]} года: {reply}.",
          "Выводит все воскресенья попадающих на 1 число месяцев."),
+    "Дни недели на 1 число":
+        ("MoreLessWeek", NumberOperations.weekday_dates_count,
+         (max_num_request, min_num_request, "Укажите день недели (Понедельник - 1, Вторник - 2 и т.д.):"),
+         "Первых чисел месяцев на этот день недели с {user_inputs[1]} до {user_inputs[0]} года: {reply}.",
+         "Считает по григорианскому календарю первые числа месяцев, выпадающие на заданный день недели."),
     "Нок": ("Ints", NumberOperations.least_multiple, [num_request],
             "Ключевые делители - {reply[1]}."
             "Наименьшее общее кратное для чисел до {user_inputs[0]}:",
@@ -347,7 +384,7 @@ Check_methods = {
         ("int", lambda user_input, user_inputs: user_input > 0, "Число должно быть не меньше нуля."),
         ("int", lambda user_input, user_inputs: user_inputs[-1] > user_input,
          "Число должно быть меньше предыдущего введенного числа."),
-        ("int", lambda user_input, user_inputs: 0 < user_input < 7, "Число должно быть соотносимо с днем недели.")
+        ("int", lambda user_input, user_inputs: 1 <= user_input <= 7, "Число должно быть соотносимо с днем недели.")
     ],
     "ListStr": [
         ("list", lambda user_input, user_inputs: True, ""),